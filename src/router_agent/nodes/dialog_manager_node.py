@@ -183,6 +183,11 @@ class DialogManagerNode(Node):
             '/safety_guard/validate_intent'
         )
         
+        # Placeholder status/constraints for validation requests, built once;
+        # call_async serializes the request, so sharing them is safe
+        self.validation_system_status = HealthStatus()
+        self.validation_safety_constraints = SafetyConstraints()
+        
         # Initialize conversation cleanup timer
         self.cleanup_timer = self.create_timer(300.0, self.cleanup_old_conversations)  # 5 minutes
         
@@ -467,8 +472,8 @@ class DialogManagerNode(Node):
             request.intent = intent
             
             # Add system status if available
-            request.system_status = HealthStatus()  # Would be populated with actual status
-            request.safety_constraints = SafetyConstraints()  # Would be populated with current constraints
+            request.system_status = self.validation_system_status  # Would be populated with actual status
+            request.safety_constraints = self.validation_safety_constraints  # Would be populated with current constraints
             
             # Call service asynchronously
             future = self.safety_validation_client.call_async(request)
@@ -11,21 +11,119 @@ ROS2 SpeechResult -> FastAPI Orchestrator -> ROS2 Response
 
 import rclpy
 from rclpy.node import Node
+from rclpy.callback_groups import ReentrantCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
 
-import requests
+from ament_index_python.packages import get_package_share_directory, PackageNotFoundError
+
+import asyncio
+import codecs
+import httpx
+import itertools
 import json
+import os
+import platform
+import random
+import uuid
 import time
 import threading
-import queue
-from typing import Dict, Any, Optional
+import yaml
+import numpy as np
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime
 
+try:
+    import h2
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import uringcore
+    HAS_URINGCORE = True
+except ImportError:
+    HAS_URINGCORE = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
 # ROS2 message imports
-from std_msgs.msg import Header, String
+from std_msgs.msg import String
 from elderly_companion.msg import SpeechResult, IntentResult
 from elderly_companion.srv import ProcessSpeech
 
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize to a JSON string for std_msgs/String payloads."""
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def json_loads(raw) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Speech that must never be dropped when the processing queue is full or
+# held back by the circuit breaker. Includes the guard's sos_keywords from
+# config/guard.yml, which are merged in again at startup in case they change
+EMERGENCY_SPEECH_KEYWORDS = ('救命', '紧急', '急救', 'help', 'emergency', '不舒服', '摔倒了', '救护车', '心口疼')
+
+
+def default_guard_config_path() -> str:
+    """Installed config/guard.yml of this package, or '' when not installed."""
+    try:
+        return os.path.join(get_package_share_directory('router_agent'), 'config', 'guard.yml')
+    except PackageNotFoundError:
+        return ''
+
+
+def load_emergency_keywords(guard_config_path: str) -> Tuple[str, ...]:
+    """EMERGENCY_SPEECH_KEYWORDS plus the guard's sos_keywords, lowercased."""
+    keywords = list(EMERGENCY_SPEECH_KEYWORDS)
+    if guard_config_path and os.path.exists(guard_config_path):
+        with open(guard_config_path, 'r', encoding='utf-8') as f:
+            keywords.extend((yaml.safe_load(f) or {}).get('sos_keywords', []))
+    return tuple(dict.fromkeys(k.lower() for k in keywords))
+
+
+# Canned reply while the orchestrator circuit breaker is open
+CIRCUIT_OPEN_RESPONSE = {'status': 'error', 'reason': 'circuit_open'}
+
+
+# Queue sentinel that ends the async processing loop on node shutdown
+SHUTDOWN_ITEM = {'type': 'shutdown', 'emergency': True}
+
+
+MSGPACK_HEADERS = {'Content-Type': 'application/msgpack', 'Accept': 'application/msgpack'}
+
+
 class FastAPIBridgeNode(Node):
     """
     Bridge Node connecting ROS2 with FastAPI microservices.
@@ -47,8 +145,36 @@ class FastAPIBridgeNode(Node):
                 ('fastapi.adapters_url', 'http://localhost:7003'),
                 ('fastapi.timeout_seconds', 10.0),
                 ('fastapi.retry_attempts', 3),
+                ('fastapi.keepalive_seconds', 60.0),
+                ('fastapi.keepalive_ping_seconds', 30.0),
+                ('fastapi.stream_threshold_bytes', 8192),
+                ('fastapi.breaker_window', 20),
+                ('fastapi.breaker_failure_ratio', 0.5),
+                ('fastapi.breaker_interval_seconds', 5.0),
+                ('fastapi.breaker_cooldown_seconds', 3.0),
+                ('fastapi.transport', 'tcp'),  # 'tcp' or 'uds'
+                ('fastapi.orchestrator_socket', '/run/elderly/orchestrator.sock'),
+                ('fastapi.guard_socket', '/run/elderly/guard.sock'),
+                ('fastapi.intent_socket', '/run/elderly/intent.sock'),
+                ('fastapi.adapters_socket', '/run/elderly/adapters.sock'),
+                ('fastapi.wire_format', 'json'),  # 'json' or 'msgpack'
                 ('bridge.enable_async_processing', True),
                 ('bridge.queue_size', 100),
+                ('bridge.use_io_uring', False),
+                ('bridge.worker_core_id', -1),  # -1 leaves the loop thread unpinned
+                ('bridge.worker_rt_priority', 0),  # SCHED_FIFO priority, 0 disables
+                ('bridge.batch_max_items', 8),
+                ('bridge.batch_window_ms', 20),
+                ('bridge.min_text_length', 1),  # 1 drops only empty/whitespace text
+                ('bridge.dedupe_window_seconds', 1.5),
+                ('bridge.use_fused_endpoint', True),
+                ('guard.config_path', ''),  # '' uses the installed config/guard.yml
+                ('cache.enabled', True),
+                ('cache.max_entries', 512),
+                ('cache.ttl_seconds', 60.0),
+                ('cache.semantic_enabled', False),
+                ('cache.embedding_model', 'all-MiniLM-L6-v2'),
+                ('cache.semantic_threshold', 0.95),
             ]
         )
         
@@ -59,19 +185,139 @@ class FastAPIBridgeNode(Node):
         self.adapters_url = self.get_parameter('fastapi.adapters_url').value
         self.request_timeout = self.get_parameter('fastapi.timeout_seconds').value
         self.retry_attempts = self.get_parameter('fastapi.retry_attempts').value
+        self.keepalive_seconds = self.get_parameter('fastapi.keepalive_seconds').value
+        self.keepalive_ping_seconds = self.get_parameter('fastapi.keepalive_ping_seconds').value
+        self.stream_threshold = self.get_parameter('fastapi.stream_threshold_bytes').value
+        self.breaker_failure_ratio = self.get_parameter('fastapi.breaker_failure_ratio').value
+        self.breaker_interval = self.get_parameter('fastapi.breaker_interval_seconds').value
+        self.breaker_cooldown = self.get_parameter('fastapi.breaker_cooldown_seconds').value
+        self.transport = self.get_parameter('fastapi.transport').value
+        self.use_msgpack = self.get_parameter('fastapi.wire_format').value == 'msgpack'
         self.enable_async = self.get_parameter('bridge.enable_async_processing').value
         self.queue_size = self.get_parameter('bridge.queue_size').value
+        self.use_io_uring = self.get_parameter('bridge.use_io_uring').value
+        self.worker_core_id = self.get_parameter('bridge.worker_core_id').value
+        self.worker_rt_priority = self.get_parameter('bridge.worker_rt_priority').value
+        self.batch_max_items = self.get_parameter('bridge.batch_max_items').value
+        self.batch_window = self.get_parameter('bridge.batch_window_ms').value / 1000.0
+        self.min_text_length = self.get_parameter('bridge.min_text_length').value
+        self.dedupe_window = self.get_parameter('bridge.dedupe_window_seconds').value
+        self.use_fused_endpoint = self.get_parameter('bridge.use_fused_endpoint').value
+        self.cache_enabled = self.get_parameter('cache.enabled').value
+        self.cache_max_entries = self.get_parameter('cache.max_entries').value
+        self.cache_ttl = self.get_parameter('cache.ttl_seconds').value
+        self.semantic_threshold = self.get_parameter('cache.semantic_threshold').value
+        
+        # Async HTTP client on a dedicated event loop thread; one keep-alive
+        # pool shared by the orchestrator, guard and intent calls
+        self.loop = self.create_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        self.loop.call_soon_threadsafe(self.tune_worker_thread)
+        
+        # Idle connections are kept well past httpx's 5 s default so sparse
+        # elderly speech doesn't pay a fresh handshake on every utterance
+        self.aclient = httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'Connection': 'keep-alive',
+                'User-Agent': 'ROS2-FastAPI-Bridge/1.0'
+            },
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=self.keepalive_seconds
+            ),
+            timeout=self.request_timeout,
+            http2=HAS_HTTP2
+        )
+        
+        # Co-located services can be reached over Unix domain sockets, skipping
+        # the loopback TCP stack; the URL host is then only cosmetic. A service
+        # with an empty socket path stays on the shared TCP client
+        self.uds_clients = []
+        self.orchestrator_client = self.create_service_client('fastapi.orchestrator_socket')
+        self.guard_client = self.create_service_client('fastapi.guard_socket')
+        self.intent_client = self.create_service_client('fastapi.intent_socket')
+        self.adapters_client = self.create_service_client('fastapi.adapters_socket')
+        
+        if self.use_msgpack and not HAS_MSGPACK:
+            self.get_logger().warning("fastapi.wire_format is msgpack but msgpack is not installed, using JSON")
+            self.use_msgpack = False
+        
+        # Endpoint URLs are fixed for the node's lifetime; build them once
+        # The fused /asr_text/full reply carries the guard decisions and the
+        # parsed intent as well, so the bridge never calls guard or intent itself
+        if self.use_msgpack:
+            asr_path = '/asr_text/msgpack'
+        elif self.use_fused_endpoint:
+            asr_path = '/asr_text/full'
+        else:
+            asr_path = '/asr_text'
+        self.asr_endpoint = f"{self.orchestrator_url}{asr_path}"
+        # Batches use the same wire format and, when fused, the same per-item reply
+        batch_path = '/asr_text/batch/msgpack' if self.use_msgpack else '/asr_text/batch'
+        self.asr_batch_endpoint = f"{self.orchestrator_url}{batch_path}"
+        self.asr_batch_full = self.use_msgpack or self.use_fused_endpoint
+        self.guard_endpoint = f"{self.guard_url}/guard/check"
+        self.intent_endpoint = f"{self.intent_url}/parse_intent"
+        self.orchestrator_health_url = f"{self.orchestrator_url}/health"
+        self.health_targets = {
+            'orchestrator': (self.orchestrator_client, self.orchestrator_health_url),
+            'guard': (self.guard_client, f"{self.guard_url}/health"),
+            'intent': (self.intent_client, f"{self.intent_url}/health"),
+            'adapters': (self.adapters_client, f"{self.adapters_url}/health")
+        }
+        
+        # Orchestrator circuit breaker, touched only on the event loop:
+        # recent (monotonic time, succeeded) outcomes and the cool-down deadline
+        self.breaker_outcomes = deque(maxlen=self.get_parameter('fastapi.breaker_window').value)
+        self.breaker_open_until = 0.0
+        
+        # Conversation ids: a per-run prefix plus a counter, instead of
+        # formatting wall-clock time for every intent
+        self.conversation_prefix = f"fastapi_bridge_{self.get_clock().now().nanoseconds // 1_000_000_000}_"
+        self.conversation_counter = itertools.count(1)
         
-        # HTTP session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'ROS2-FastAPI-Bridge/1.0'
-        })
+        # Trivial-input filter state; best-effort under concurrent callbacks,
+        # a race can only let a duplicate through to the orchestrator
+        self.last_text = None
+        self.last_text_time = 0.0
         
-        # Processing queue for async handling
-        self.processing_queue = queue.Queue(maxsize=self.queue_size)
-        self.response_cache = {}  # Simple cache for recent responses
+        # Emergency keywords shared with the guard service's SOS check
+        guard_config_path = self.get_parameter('guard.config_path').value or default_guard_config_path()
+        try:
+            self.emergency_keywords = load_emergency_keywords(guard_config_path)
+        except Exception as e:
+            self.get_logger().error(f"Guard config load error, using built-in emergency keywords: {e}")
+            self.emergency_keywords = EMERGENCY_SPEECH_KEYWORDS
+        
+        # Processing queue for async handling. Owned by the event loop thread
+        # (producers hop over with call_soon_threadsafe), so a plain deque plus
+        # an asyncio.Event needs no cross-thread locking
+        self.processing_queue = deque()
+        self.processing_ready = asyncio.Event()
+        self.inflight_tasks = set()
+        
+        # Speech refused while the breaker is open, resent once it half-opens
+        self.breaker_deferred = deque()
+        self.breaker_resend_handle = None
+        
+        # Response cache for recent utterances, touched only on the event loop:
+        # normalized text -> (expires_at, response_data, embedding row or None)
+        self.response_cache = OrderedDict()
+        self.embedding_model = None
+        if self.cache_enabled and self.get_parameter('cache.semantic_enabled').value:
+            if HAS_SENTENCE_TRANSFORMERS:
+                self.embedding_model = SentenceTransformer(self.get_parameter('cache.embedding_model').value)
+            else:
+                self.get_logger().warning("cache.semantic_enabled set but sentence-transformers is not installed")
+        
+        # Semantic cache rows packed into one (N, D) float32 matrix so lookup
+        # is a single matvec; row i belongs to cache_row_keys[i]. Allocated on
+        # the first embedding, once the model's dimension is known
+        self.cache_vectors = None
+        self.cache_row_keys = []
         
         # QoS profiles
         reliable_qos = QoSProfile(
@@ -80,12 +326,17 @@ class FastAPIBridgeNode(Node):
             depth=50
         )
         
+        # Callbacks may run concurrently under the MultiThreadedExecutor, so
+        # a blocking process_text call never stalls incoming speech
+        self.callback_group = ReentrantCallbackGroup()
+        
         # Subscribers
         self.speech_result_sub = self.create_subscription(
             SpeechResult,
             '/speech/with_emotion',
             self.handle_speech_result_callback,
-            reliable_qos
+            reliable_qos,
+            callback_group=self.callback_group
         )
         
         # Publishers
@@ -107,50 +358,138 @@ class FastAPIBridgeNode(Node):
             reliable_qos
         )
         
+        # Large orchestrator bodies are forwarded here chunk by chunk as they
+        # arrive; an empty message marks the end of each body
+        self.response_stream_pub = self.create_publisher(
+            String,
+            '/fastapi/response_stream',
+            reliable_qos
+        )
+        
+        # Outgoing messages refilled for every response. publish() serializes
+        # synchronously, so reuse is safe as long as only the event loop thread
+        # publishes them and nothing keeps a reference after publishing
+        self.response_msg = String()
+        self.intent_msg = IntentResult()
+        
         # Services
         self.process_text_service = self.create_service(
             ProcessSpeech,
             '/fastapi_bridge/process_text',
-            self.process_text_service_callback
+            self.process_text_service_callback,
+            callback_group=self.callback_group
         )
         
-        # Start async processing thread if enabled
+        # Start async processing on the bridge loop if enabled
         if self.enable_async:
-            self.processing_thread = threading.Thread(
-                target=self.async_processing_loop,
-                daemon=True
-            )
-            self.processing_thread.start()
+            self.processing_future = asyncio.run_coroutine_threadsafe(self.async_processing_loop(), self.loop)
         
-        # Test FastAPI services availability
+        # Test FastAPI services availability; the probes also pre-warm the
+        # connection pool so the first utterance skips the TCP handshake
         self.test_fastapi_services()
         
+        # Keep the orchestrator connection warm between sparse utterances
+        if self.keepalive_ping_seconds > 0:
+            self.keepalive_timer = self.create_timer(
+                self.keepalive_ping_seconds, self.keepalive_ping_callback,
+                callback_group=self.callback_group
+            )
+        
         self.get_logger().info(f"FastAPI Bridge Node initialized - Orchestrator: {self.orchestrator_url}")
 
+    def create_service_client(self, socket_parameter: str) -> httpx.AsyncClient:
+        """Return a UDS client for a service when fastapi.transport is uds, else the TCP client."""
+        socket_path = self.get_parameter(socket_parameter).value
+        if self.transport != 'uds' or not socket_path:
+            return self.aclient
+        
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=socket_path),
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'ROS2-FastAPI-Bridge/1.0'
+            },
+            timeout=self.request_timeout
+        )
+        self.uds_clients.append(client)
+        return client
+
+    def create_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the bridge event loop, io_uring-backed when enabled and supported."""
+        if self.use_io_uring:
+            if not HAS_URINGCORE:
+                self.get_logger().warning("bridge.use_io_uring set but uringcore is not installed")
+            elif not self.kernel_supports_io_uring():
+                self.get_logger().warning("bridge.use_io_uring requires Linux kernel >= 5.11")
+            else:
+                try:
+                    loop = uringcore.EventLoopPolicy().new_event_loop()
+                    self.get_logger().info("Using io_uring event loop for FastAPI calls")
+                    return loop
+                except Exception as e:
+                    self.get_logger().warning(f"io_uring event loop unavailable: {e}")
+        
+        return asyncio.new_event_loop()
+
+    def tune_worker_thread(self):
+        """Pin the event loop thread to a core and give it real-time priority if configured."""
+        # Both calls act on the calling thread on Linux, so this runs on the loop
+        if self.worker_core_id >= 0 and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {self.worker_core_id})
+                self.get_logger().info(f"Bridge worker pinned to CPU {self.worker_core_id}")
+            except OSError as e:
+                self.get_logger().warning(f"Could not pin bridge worker to CPU {self.worker_core_id}: {e}")
+        
+        if self.worker_rt_priority > 0 and hasattr(os, 'sched_setscheduler'):
+            if not self.has_cap_sys_nice():
+                self.get_logger().warning("bridge.worker_rt_priority set but CAP_SYS_NICE is not available")
+                return
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.worker_rt_priority))
+                self.get_logger().info(f"Bridge worker running SCHED_FIFO priority {self.worker_rt_priority}")
+            except OSError as e:
+                self.get_logger().warning(f"Could not raise bridge worker priority: {e}")
+
+    def has_cap_sys_nice(self) -> bool:
+        """Check the effective capability set for CAP_SYS_NICE (bit 23)."""
+        try:
+            with open('/proc/self/status') as status:
+                for line in status:
+                    if line.startswith('CapEff:'):
+                        return bool(int(line.split()[1], 16) & (1 << 23))
+        except OSError:
+            pass
+        return False
+
+    def kernel_supports_io_uring(self) -> bool:
+        """Check for Linux kernel 5.11+, the first release with stable io_uring networking."""
+        if platform.system() != 'Linux':
+            return False
+        try:
+            major, minor = (int(part) for part in os.uname().release.split('.')[:2])
+            return (major, minor) >= (5, 11)
+        except ValueError:
+            return False
+
     def test_fastapi_services(self):
         """Test availability of FastAPI services."""
-        services = {
-            'orchestrator': f"{self.orchestrator_url}/health",
-            'guard': f"{self.guard_url}/health", 
-            'intent': f"{self.intent_url}/health",
-            'adapters': f"{self.adapters_url}/health"
-        }
-        
         available_services = []
         unavailable_services = []
         
-        for service_name, health_url in services.items():
-            try:
-                response = self.session.get(health_url, timeout=5)
-                if response.status_code == 200:
-                    available_services.append(service_name)
-                    self.get_logger().info(f"✅ {service_name} service available")
-                else:
-                    unavailable_services.append(service_name)
-                    self.get_logger().warning(f"⚠️ {service_name} service responded with {response.status_code}")
-            except Exception as e:
+        # Probe all services concurrently: startup waits for the slowest, not the sum
+        results = self.run_coroutine(self.probe_services(list(self.health_targets.values())))
+        
+        for service_name, (status_code, error) in zip(self.health_targets, results):
+            if status_code == 200:
+                available_services.append(service_name)
+                self.get_logger().info(f"✅ {service_name} service available")
+            elif error is None:
+                unavailable_services.append(service_name)
+                self.get_logger().warning(f"⚠️ {service_name} service responded with {status_code}")
+            else:
                 unavailable_services.append(service_name)
-                self.get_logger().warning(f"❌ {service_name} service unavailable: {e}")
+                self.get_logger().warning(f"❌ {service_name} service unavailable: {error}")
         
         # Publish bridge status
         status_data = {
@@ -161,24 +500,51 @@ class FastAPIBridgeNode(Node):
         }
         
         status_msg = String()
-        status_msg.data = json.dumps(status_data)
+        status_msg.data = json_dumps(status_data)
         self.bridge_status_pub.publish(status_msg)
 
+    async def probe_services(self, targets: List[Tuple[httpx.AsyncClient, str]]) -> List[Tuple[Optional[int], Optional[Exception]]]:
+        """Probe several health endpoints concurrently on the bridge loop."""
+        return await asyncio.gather(*(self.probe_service(client, url) for client, url in targets))
+
+    async def probe_service(self, client: httpx.AsyncClient, health_url: str) -> Tuple[Optional[int], Optional[Exception]]:
+        """GET a health endpoint, returning (status_code, error)."""
+        try:
+            response = await client.get(health_url, timeout=5)
+            return response.status_code, None
+        except Exception as e:
+            return None, e
+
+    def keepalive_ping_callback(self):
+        """Touch the orchestrator so its pooled connection is not reaped as idle."""
+        asyncio.run_coroutine_threadsafe(self.ping_orchestrator(), self.loop)
+
+    async def ping_orchestrator(self):
+        """Cheap GET on the orchestrator over the pooled connection."""
+        try:
+            await self.orchestrator_client.get(self.orchestrator_health_url, timeout=2.0)
+        except Exception as e:
+            self.get_logger().debug(f"Orchestrator keepalive ping failed: {e}")
+
+    def run_coroutine(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the bridge event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
     def handle_speech_result_callback(self, msg: SpeechResult):
         """Handle speech result and bridge to FastAPI orchestrator."""
         try:
+            if self.short_circuit_speech(msg):
+                return
+            
             self.get_logger().info(f"Bridge processing speech: '{msg.text}'")
             
             if self.enable_async:
                 # Add to async processing queue
-                try:
-                    self.processing_queue.put_nowait({
-                        'type': 'speech_result',
-                        'data': msg,
-                        'timestamp': time.time()
-                    })
-                except queue.Full:
-                    self.get_logger().error("Processing queue full, dropping speech result")
+                self.loop.call_soon_threadsafe(self.enqueue_speech_item, {
+                    'type': 'speech_result',
+                    'data': msg,
+                    'emergency': self.is_emergency_speech(msg)
+                })
             else:
                 # Process synchronously
                 self.process_speech_result(msg)
@@ -186,7 +552,71 @@ class FastAPIBridgeNode(Node):
         except Exception as e:
             self.get_logger().error(f"Speech result handling error: {e}")
 
+    def is_emergency_speech(self, msg: SpeechResult) -> bool:
+        """Cheap check used to protect emergencies from queue overflow drops."""
+        return msg.emotion.stress_level > 0.8 or self.is_emergency_text(msg.text)
+
+    def is_emergency_text(self, text: str) -> bool:
+        """Keyword check for emergency speech."""
+        text = text.lower()
+        return any(k in text for k in self.emergency_keywords)
+
+    def enqueue_speech_item(self, item: Dict[str, Any]):
+        """Queue a speech item on the event loop, evicting the oldest non-emergency when full."""
+        if len(self.processing_queue) >= self.queue_size:
+            victim = next(
+                (index for index, queued in enumerate(self.processing_queue) if not queued['emergency']),
+                None
+            )
+            if victim is not None:
+                del self.processing_queue[victim]
+                self.get_logger().warning("Processing queue full, dropped oldest non-emergency speech result")
+            elif item['emergency']:
+                self.processing_queue.popleft()
+                self.get_logger().error("Processing queue full of emergencies, dropped oldest")
+            else:
+                self.get_logger().error("Processing queue full, dropping speech result")
+                return
+        
+        self.processing_queue.append(item)
+        self.processing_ready.set()
+
+    async def wait_for_speech_item(self):
+        """Wait until the processing queue is non-empty."""
+        while not self.processing_queue:
+            self.processing_ready.clear()
+            await self.processing_ready.wait()
+
+    def short_circuit_speech(self, msg: SpeechResult) -> bool:
+        """Drop malformed speech that needs no orchestrator round trip.
+        
+        Returns True when the message should be dropped: empty after
+        stripping, or a repeat of the previous text within the dedupe window.
+        Emergency speech is never dropped, even when repeated.
+        """
+        if self.is_emergency_speech(msg):
+            return False
+        
+        text = msg.text.strip()
+        now = time.monotonic()
+        
+        if len(text) < self.min_text_length:
+            self.get_logger().debug(f"Dropping trivial speech input: '{text}'")
+            return True
+        
+        if text == self.last_text and now - self.last_text_time < self.dedupe_window:
+            self.get_logger().debug(f"Dropping repeated speech input: '{text}'")
+            return True
+        
+        self.last_text = text
+        self.last_text_time = now
+        return False
+
     def process_speech_result(self, speech_msg: SpeechResult):
+        """Process speech result through FastAPI orchestrator, blocking until done."""
+        self.run_coroutine(self.aprocess_speech_result(speech_msg))
+
+    async def aprocess_speech_result(self, speech_msg: SpeechResult):
         """Process speech result through FastAPI orchestrator."""
         try:
             start_time = time.time()
@@ -196,68 +626,340 @@ class FastAPIBridgeNode(Node):
                 "text": speech_msg.text
             }
             
-            # Call FastAPI orchestrator
-            response_data = self.call_fastapi_orchestrator(request_data)
+            # Call FastAPI orchestrator; queued messages also carry a stress level
+            response_data = await self.call_fastapi_orchestrator(
+                request_data, critical=self.is_emergency_speech(speech_msg))
             
-            if response_data:
+            if not self.orchestrator_failed(response_data):
                 # Process successful response
                 self.handle_orchestrator_response(response_data, speech_msg)
                 
                 processing_time = (time.time() - start_time) * 1000
                 self.get_logger().info(f"FastAPI processing completed in {processing_time:.1f}ms")
+            elif response_data:
+                self.defer_until_breaker_closes([speech_msg])
             else:
-                self.get_logger().error("FastAPI orchestrator returned no response")
+                self.get_logger().error(f"FastAPI orchestrator returned no usable response: {response_data}")
                 
         except Exception as e:
             self.get_logger().error(f"Speech result processing error: {e}")
 
-    def call_fastapi_orchestrator(self, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Call FastAPI orchestrator with retry logic."""
-        orchestrator_endpoint = f"{self.orchestrator_url}/asr_text"
+    async def aprocess_speech_batch(self, speech_msgs: List[SpeechResult]):
+        """Process several speech results with one orchestrator /asr_text/batch call."""
+        try:
+            start_time = time.time()
+            
+            # Answer cached utterances first; key the rest so responses can be
+            # matched back to their message and cache slot
+            pending = {}
+            for msg in speech_msgs:
+                cache_slot = None
+                if self.cache_enabled:
+                    cached, cache_key, embedding = await self.lookup_response_for_text(msg.text)
+                    if cached is not None:
+                        self.handle_orchestrator_response(cached, msg)
+                        continue
+                    cache_slot = (cache_key, embedding)
+                pending[uuid.uuid4().hex] = (msg, cache_slot)
+            
+            if not pending:
+                return
+            
+            request_data = {
+                "requests": [{"id": item_id, "text": msg.text} for item_id, (msg, _) in pending.items()],
+                "full": self.asr_batch_full
+            }
+            
+            critical = any(self.is_emergency_speech(msg) for msg, _ in pending.values())
+            batch_data = await self.post_with_retry(
+                self.asr_batch_endpoint, request_data, self.use_msgpack, critical)
+            
+            if batch_data and self.orchestrator_failed(batch_data):
+                # Breaker is open; per-utterance calls would be refused as well
+                self.defer_until_breaker_closes([msg for msg, _ in pending.values()])
+                return
+            
+            if not batch_data or 'responses' not in batch_data:
+                # Batch endpoint unavailable; fall back to one call per utterance
+                self.get_logger().warning("FastAPI batch call failed, processing utterances individually")
+                await asyncio.gather(*(self.aprocess_speech_result(msg) for msg, _ in pending.values()))
+                return
+            
+            for item in batch_data.get('responses', []):
+                speech_msg, cache_slot = pending.get(item.get('id'), (None, None))
+                response_data = item.get('response')
+                if speech_msg is None or not response_data:
+                    continue
+                self.handle_orchestrator_response(response_data, speech_msg)
+                if cache_slot is not None and self.is_cacheable_response(response_data):
+                    self.store_cached_response(cache_slot[0], response_data, cache_slot[1])
+            
+            processing_time = (time.time() - start_time) * 1000
+            self.get_logger().info(f"FastAPI batch of {len(speech_msgs)} completed in {processing_time:.1f}ms")
+            
+        except Exception as e:
+            self.get_logger().error(f"Speech batch processing error: {e}")
+
+    def defer_until_breaker_closes(self, speech_msgs: List[SpeechResult]):
+        """Hold speech refused by the open breaker and resend it when the cool-down ends."""
+        self.breaker_deferred.extend(speech_msgs)
+        self.get_logger().warning(
+            f"FastAPI orchestrator circuit open, holding {len(self.breaker_deferred)} speech result(s)"
+        )
+        if self.breaker_resend_handle is None:
+            delay = max(0.0, self.breaker_open_until - time.monotonic())
+            self.breaker_resend_handle = self.loop.call_later(delay, self.resend_deferred_speech)
+
+    def resend_deferred_speech(self):
+        """Resend held speech once the breaker half-opens; it is held again if refused."""
+        self.breaker_resend_handle = None
+        delay = self.breaker_open_until - time.monotonic()
+        if delay > 0:
+            # Breaker re-tripped during the cool-down; wait for the new deadline
+            self.breaker_resend_handle = self.loop.call_later(delay, self.resend_deferred_speech)
+            return
+        
+        speech_msgs = list(self.breaker_deferred)
+        self.breaker_deferred.clear()
+        self.get_logger().info(f"FastAPI orchestrator circuit half-open, resending {len(speech_msgs)} speech result(s)")
+        self.dispatch_speech(speech_msgs)
+
+    def dispatch_speech(self, speech_msgs: List[SpeechResult]):
+        """Process speech results as a tracked task so requests overlap in flight."""
+        if len(speech_msgs) == 1:
+            task = asyncio.create_task(self.aprocess_speech_result(speech_msgs[0]))
+        elif speech_msgs:
+            task = asyncio.create_task(self.aprocess_speech_batch(speech_msgs))
+        else:
+            return
+        
+        self.inflight_tasks.add(task)
+        task.add_done_callback(self.inflight_tasks.discard)
+
+    def orchestrator_failed(self, response_data: Optional[Dict[str, Any]]) -> bool:
+        """True when an orchestrator call produced no usable reply, including an open breaker."""
+        return not response_data or response_data.get('reason') == CIRCUIT_OPEN_RESPONSE['reason']
+
+    async def call_fastapi_orchestrator(self, request_data: Dict[str, Any],
+                                        critical: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Call FastAPI orchestrator with retry logic, answering repeats from cache.
+        
+        critical lets emergencies bypass the circuit breaker; when not given
+        it falls back to the emergency keyword check on the text.
+        """
+        if critical is None:
+            critical = self.is_emergency_text(request_data['text'])
+        if not self.cache_enabled:
+            return await self.post_with_retry(self.asr_endpoint, request_data, self.use_msgpack, critical)
+        
+        cached, cache_key, embedding = await self.lookup_response_for_text(request_data['text'])
+        if cached is not None:
+            return cached
+        
+        response_data = await self.post_with_retry(self.asr_endpoint, request_data, self.use_msgpack, critical)
+        if response_data and self.is_cacheable_response(response_data):
+            self.store_cached_response(cache_key, response_data, embedding)
+        
+        return response_data
+
+    async def lookup_response_for_text(self, text: str) -> Tuple[Optional[Dict[str, Any]], str, Optional[np.ndarray]]:
+        """Look up a cached reply for text, returning (reply or None, cache key, embedding)."""
+        cache_key = ' '.join(text.lower().split())
+        embedding = None
+        if self.embedding_model is not None:
+            # Model inference is CPU-bound; keep it off the event loop
+            embedding = await self.loop.run_in_executor(None, self.embed_text, cache_key)
+        
+        return self.lookup_cached_response(cache_key, embedding), cache_key, embedding
+
+    def embed_text(self, text: str) -> np.ndarray:
+        """Unit-length sentence embedding for semantic cache matching."""
+        return self.embedding_model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def is_cacheable_response(self, response_data: Dict[str, Any]) -> bool:
+        """Only cache replies that are safe to replay without the orchestrator.
+        
+        Emergencies and confirmations must always reach the orchestrator, and
+        replies carrying an adapter result mean a device or call was actioned;
+        replaying those from cache would skip the side effect.
+        """
+        return (response_data.get('status') not in ('emergency_dispatched', 'need_confirm', 'error')
+                and 'adapter' not in response_data)
+
+    def lookup_cached_response(self, cache_key: str, embedding: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+        """Find a live cached reply by exact text, then by embedding similarity."""
+        now = time.monotonic()
+        
+        entry = self.response_cache.get(cache_key)
+        if entry is not None:
+            if entry[0] > now:
+                self.response_cache.move_to_end(cache_key)
+                return dict(entry[1], cache_hit='exact')
+            self.evict_cached_response(cache_key)
+        
+        row_count = len(self.cache_row_keys)
+        if embedding is None or row_count == 0:
+            return None
+        
+        # Rows are unit length, so one matvec gives every cosine similarity
+        scores = self.cache_vectors[:row_count] @ embedding
+        best = int(scores.argmax())
+        if scores[best] < self.semantic_threshold:
+            return None
+        
+        best_key = self.cache_row_keys[best]
+        expires_at, response_data, _ = self.response_cache[best_key]
+        if expires_at <= now:
+            self.evict_cached_response(best_key)
+            return None
+        
+        self.response_cache.move_to_end(best_key)
+        return dict(response_data, cache_hit='semantic')
+
+    def store_cached_response(self, cache_key: str, response_data: Dict[str, Any],
+                              embedding: Optional[np.ndarray]):
+        """Insert a reply into the LRU response cache."""
+        if cache_key in self.response_cache:
+            self.evict_cached_response(cache_key)
+        while len(self.response_cache) >= self.cache_max_entries:
+            self.evict_cached_response(next(iter(self.response_cache)))
+        
+        row = None
+        if embedding is not None:
+            if self.cache_vectors is None:
+                self.cache_vectors = np.empty((self.cache_max_entries, embedding.shape[0]), dtype=np.float32)
+            row = len(self.cache_row_keys)
+            self.cache_vectors[row] = embedding
+            self.cache_row_keys.append(cache_key)
+        
+        self.response_cache[cache_key] = (time.monotonic() + self.cache_ttl, response_data, row)
+
+    def evict_cached_response(self, cache_key: str):
+        """Drop a cache entry, swap-removing its embedding row to keep the matrix dense."""
+        _, _, row = self.response_cache.pop(cache_key)
+        if row is None:
+            return
+        
+        last = len(self.cache_row_keys) - 1
+        if row != last:
+            moved_key = self.cache_row_keys[last]
+            self.cache_vectors[row] = self.cache_vectors[last]
+            self.cache_row_keys[row] = moved_key
+            expires_at, response_data, _ = self.response_cache[moved_key]
+            self.response_cache[moved_key] = (expires_at, response_data, row)
+        self.cache_row_keys.pop()
+
+    async def post_with_retry(self, orchestrator_endpoint: str, request_data: Dict[str, Any],
+                              use_msgpack: bool = False, critical: bool = False) -> Optional[Dict[str, Any]]:
+        """POST to an orchestrator endpoint, retrying transient failures.
+        
+        While the circuit breaker is open, non-critical requests get
+        CIRCUIT_OPEN_RESPONSE at once; emergencies always go out.
+        """
+        if use_msgpack:
+            content, headers = msgpack.packb(request_data), MSGPACK_HEADERS
+        else:
+            content, headers = json_dumps_bytes(request_data), None
         
         for attempt in range(self.retry_attempts):
+            if not critical and time.monotonic() < self.breaker_open_until:
+                return dict(CIRCUIT_OPEN_RESPONSE)
+            
             try:
                 self.get_logger().debug(f"Calling FastAPI orchestrator (attempt {attempt + 1}): {request_data}")
                 
-                response = self.session.post(
-                    orchestrator_endpoint,
-                    json=request_data,
-                    timeout=self.request_timeout
-                )
+                async with self.orchestrator_client.stream(
+                    'POST', orchestrator_endpoint, content=content, headers=headers
+                ) as response:
+                    if response.status_code == 200:
+                        if use_msgpack:
+                            body = await response.aread()
+                        else:
+                            body = await self.read_response_body(response)
+                    else:
+                        await response.aread()
                 
                 if response.status_code == 200:
-                    response_data = response.json()
+                    if use_msgpack:
+                        response_data = msgpack.unpackb(body)
+                    else:
+                        response_data = json_loads(body)
                     self.get_logger().debug(f"FastAPI response: {response_data}")
+                    self.record_orchestrator_outcome(True)
                     return response_data
                 else:
                     self.get_logger().warning(f"FastAPI returned status {response.status_code}: {response.text}")
                     
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 self.get_logger().warning(f"FastAPI request timeout (attempt {attempt + 1})")
-            except requests.exceptions.ConnectionError:
+            except httpx.TransportError:
                 self.get_logger().warning(f"FastAPI connection error (attempt {attempt + 1})")
             except Exception as e:
                 self.get_logger().error(f"FastAPI request error (attempt {attempt + 1}): {e}")
             
+            self.record_orchestrator_outcome(False)
             if attempt < self.retry_attempts - 1:
-                time.sleep(0.5 * (attempt + 1))  # Exponential backoff
+                # Exponential backoff with jitter so queued retries don't align;
+                # awaiting keeps other in-flight requests progressing meanwhile
+                await asyncio.sleep(0.5 * (2 ** attempt) + random.uniform(0, 0.1))
         
         return None
 
+    async def read_response_body(self, response: httpx.Response) -> bytes:
+        """Read a JSON body, forwarding it to /fastapi/response_stream as it arrives when large."""
+        content_length = response.headers.get('content-length')
+        if content_length is not None and int(content_length) <= self.stream_threshold:
+            return await response.aread()
+        
+        # Unknown or large size: subscribers see the text before the whole
+        # body is in; chunk edges may split multi-byte UTF-8, hence the decoder
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        chunks = []
+        chunk_msg = String()
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            chunk_msg.data = decoder.decode(chunk)
+            if chunk_msg.data:
+                self.response_stream_pub.publish(chunk_msg)
+        
+        chunk_msg.data = decoder.decode(b'', final=True)
+        if chunk_msg.data:
+            self.response_stream_pub.publish(chunk_msg)
+        chunk_msg.data = ''
+        self.response_stream_pub.publish(chunk_msg)
+        return b''.join(chunks)
+
+    def record_orchestrator_outcome(self, succeeded: bool):
+        """Track an orchestrator attempt and open the breaker on a high recent failure rate."""
+        now = time.monotonic()
+        self.breaker_outcomes.append((now, succeeded))
+        
+        recent = [ok for stamp, ok in self.breaker_outcomes if now - stamp <= self.breaker_interval]
+        failures = recent.count(False)
+        # Require a few samples so one timeout after a quiet spell doesn't trip it
+        if len(recent) >= 4 and failures / len(recent) > self.breaker_failure_ratio:
+            if now >= self.breaker_open_until:
+                self.get_logger().warning(
+                    f"Orchestrator failing ({failures}/{len(recent)} recent attempts), "
+                    f"pausing non-emergency calls for {self.breaker_cooldown:.1f}s"
+                )
+            self.breaker_open_until = now + self.breaker_cooldown
+
     def handle_orchestrator_response(self, response_data: Dict[str, Any], original_speech: SpeechResult):
         """Handle response from FastAPI orchestrator."""
         try:
-            # Publish raw FastAPI response
-            response_msg = String()
-            response_msg.data = json.dumps(response_data)
-            self.fastapi_response_pub.publish(response_msg)
+            # Publish raw FastAPI response; serialized once and reused below
+            raw_json = json_dumps(response_data)
+            self.response_msg.data = raw_json
+            self.fastapi_response_pub.publish(self.response_msg)
             
             # Extract and publish processed intent if available
             if 'intent' in response_data:
-                intent_result = self.create_intent_result_from_response(
-                    response_data, original_speech
+                self.create_intent_result_from_response(
+                    response_data, original_speech, raw_json=raw_json,
+                    intent_result=self.intent_msg
                 )
-                self.processed_intent_pub.publish(intent_result)
+                self.processed_intent_pub.publish(self.intent_msg)
             
             # Log response status
             status = response_data.get('status', 'unknown')
@@ -274,49 +976,80 @@ class FastAPIBridgeNode(Node):
             self.get_logger().error(f"Orchestrator response handling error: {e}")
 
     def create_intent_result_from_response(self, response_data: Dict[str, Any], 
-                                         original_speech: SpeechResult) -> IntentResult:
-        """Create IntentResult from FastAPI response."""
-        intent_result = IntentResult()
-        intent_result.header = Header()
-        intent_result.header.stamp = self.get_clock().now().to_msg()
-        intent_result.header.frame_id = "fastapi_bridge"
-        
-        # Extract intent information
-        intent_data = response_data.get('intent', {})
-        intent_result.intent_type = intent_data.get('intent', 'unknown')
-        intent_result.confidence = intent_data.get('confidence', 0.0)
-        
-        # Map FastAPI response to ROS2 intent fields
-        if 'adapter' in response_data:
-            intent_result.adapter_used = response_data['adapter']
+                                         original_speech: SpeechResult,
+                                         raw_json: Optional[str] = None,
+                                         intent_result: Optional[IntentResult] = None) -> IntentResult:
+        """Create IntentResult from FastAPI response, refilling intent_result when given."""
+        if intent_result is None:
+            intent_result = IntentResult()
         
-        intent_result.processing_successful = response_data.get('status') == 'ok'
-        intent_result.requires_confirmation = response_data.get('status') == 'need_confirm'
+        intent_data = response_data.get('intent') or {}
+        status = response_data.get('status')
+        header = intent_result.header
+        header.stamp = self.get_clock().now().to_msg()
+        header.frame_id = "fastapi_bridge"
         
-        # Add bridge context
-        intent_result.conversation_id = f"fastapi_bridge_{int(time.time())}"
+        intent_result.intent_type = intent_data.get('intent', 'unknown')
+        intent_result.confidence = float(intent_data.get('confidence', 0.0))
+        intent_result.adapter_used = response_data.get('adapter', '')
+        intent_result.processing_successful = status == 'ok'
+        intent_result.requires_confirmation = status == 'need_confirm'
+        intent_result.conversation_id = f"{self.conversation_prefix}{next(self.conversation_counter)}"
         intent_result.original_speech = original_speech
-        intent_result.fastapi_response = json.dumps(response_data)
+        intent_result.fastapi_response = raw_json if raw_json is not None else json_dumps(response_data)
         
         return intent_result
 
-    def async_processing_loop(self):
+    async def drain_batch(self) -> List[Dict[str, Any]]:
+        """Take the next queue item, then any that arrive within the batch window."""
+        await self.wait_for_speech_item()
+        items = [self.processing_queue.popleft()]
+        deadline = self.loop.time() + self.batch_window
+        
+        # Emergencies (and the shutdown sentinel) flush at once, never waiting out the window
+        while len(items) < self.batch_max_items and not items[-1]['emergency']:
+            if not self.processing_queue:
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self.wait_for_speech_item(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            items.append(self.processing_queue.popleft())
+        
+        return items
+
+    async def async_processing_loop(self):
         """Async processing loop for handling speech results."""
-        while rclpy.ok():
+        # Blocks on the queue with no timeout; shutdown arrives as SHUTDOWN_ITEM
+        shutting_down = False
+        while not shutting_down:
             try:
-                # Get item from queue with timeout
-                item = self.processing_queue.get(timeout=1.0)
-                
-                if item['type'] == 'speech_result':
-                    speech_msg = item['data']
-                    self.process_speech_result(speech_msg)
+                # Micro-batch utterances that arrive close together (partial + final)
+                items = await self.drain_batch()
+                shutting_down = any(item is SHUTDOWN_ITEM for item in items)
+                speech_msgs = [item['data'] for item in items if item['type'] == 'speech_result']
                 
-                self.processing_queue.task_done()
+                self.dispatch_speech(speech_msgs)
                 
-            except queue.Empty:
-                continue
             except Exception as e:
                 self.get_logger().error(f"Async processing error: {e}")
+        
+        # Let utterances already sent to the orchestrator finish publishing
+        await asyncio.gather(*self.inflight_tasks, return_exceptions=True)
+
+    def enqueue_shutdown(self):
+        """Wake the processing loop with the shutdown sentinel, bypassing the size limit."""
+        if self.breaker_resend_handle is not None:
+            self.breaker_resend_handle.cancel()
+            self.breaker_resend_handle = None
+        if self.breaker_deferred:
+            self.get_logger().warning(
+                f"Shutting down with {len(self.breaker_deferred)} speech result(s) held by the circuit breaker"
+            )
+        self.processing_queue.append(SHUTDOWN_ITEM)
+        self.processing_ready.set()
 
     def process_text_service_callback(self, request, response):
         """Handle service callback for direct text processing."""
@@ -327,11 +1060,11 @@ class FastAPIBridgeNode(Node):
             request_data = {"text": request.text}
             
             # Call FastAPI orchestrator
-            response_data = self.call_fastapi_orchestrator(request_data)
+            response_data = self.run_coroutine(self.call_fastapi_orchestrator(request_data))
             
-            if response_data:
+            if not self.orchestrator_failed(response_data):
                 response.processing_successful = True
-                response.result_data = json.dumps(response_data)
+                response.result_data = json_dumps(response_data)
                 response.processing_time_ms = 100.0  # Placeholder
                 
                 # Check if emergency was dispatched
@@ -339,6 +1072,9 @@ class FastAPIBridgeNode(Node):
                     response.emergency_triggered = True
                 
                 self.get_logger().info(f"Direct text processing completed: {response_data.get('status', 'unknown')}")
+            elif response_data:
+                response.processing_successful = False
+                response.error_message = "FastAPI orchestrator circuit open"
             else:
                 response.processing_successful = False
                 response.error_message = "FastAPI orchestrator call failed"
@@ -351,25 +1087,19 @@ class FastAPIBridgeNode(Node):
             response.error_message = str(e)
             return response
 
-    def call_guard_service(self, text: str, intent: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    async def call_guard_service(self, text: str, intent: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Direct call to FastAPI guard service."""
         try:
-            guard_endpoint = f"{self.guard_url}/guard/check"
-            
             request_data = {
                 "type": "intent" if intent else "asr",
                 "text": text,
                 "intent": intent
             }
             
-            response = self.session.post(
-                guard_endpoint,
-                json=request_data,
-                timeout=self.request_timeout
-            )
+            response = await self.guard_client.post(self.guard_endpoint, content=json_dumps_bytes(request_data))
             
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 self.get_logger().warning(f"Guard service returned {response.status_code}")
                 return None
@@ -378,21 +1108,15 @@ class FastAPIBridgeNode(Node):
             self.get_logger().error(f"Guard service call error: {e}")
             return None
 
-    def call_intent_service(self, text: str) -> Optional[Dict[str, Any]]:
+    async def call_intent_service(self, text: str) -> Optional[Dict[str, Any]]:
         """Direct call to FastAPI intent service."""
         try:
-            intent_endpoint = f"{self.intent_url}/parse_intent"
-            
             request_data = {"text": text}
             
-            response = self.session.post(
-                intent_endpoint,
-                json=request_data,
-                timeout=self.request_timeout
-            )
+            response = await self.intent_client.post(self.intent_endpoint, content=json_dumps_bytes(request_data))
             
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 self.get_logger().warning(f"Intent service returned {response.status_code}")
                 return None
@@ -401,11 +1125,24 @@ class FastAPIBridgeNode(Node):
             self.get_logger().error(f"Intent service call error: {e}")
             return None
 
+    def destroy_node(self):
+        """Stop the processing loop before tearing down the node."""
+        if hasattr(self, 'processing_future'):
+            self.loop.call_soon_threadsafe(self.enqueue_shutdown)
+            try:
+                self.processing_future.result(timeout=self.request_timeout)
+            except Exception as e:
+                self.get_logger().warning(f"Processing loop did not stop cleanly: {e}")
+        super().destroy_node()
+
     def __del__(self):
         """Clean up when node is destroyed."""
         try:
-            if hasattr(self, 'session'):
-                self.session.close()
+            if hasattr(self, 'aclient'):
+                for client in self.uds_clients:
+                    self.run_coroutine(client.aclose(), timeout=2.0)
+                self.run_coroutine(self.aclient.aclose(), timeout=2.0)
+                self.loop.call_soon_threadsafe(self.loop.stop)
         except:
             pass
 
@@ -414,14 +1151,19 @@ def main(args=None):
     """Main entry point."""
     rclpy.init(args=args)
     
+    node = None
     try:
         node = FastAPIBridgeNode()
-        rclpy.spin(node)
+        executor = MultiThreadedExecutor(num_threads=4)
+        executor.add_node(node)
+        executor.spin()
     except KeyboardInterrupt:
         pass
     except Exception as e:
         print(f"FastAPI Bridge Node error: {e}")
     finally:
+        if node is not None:
+            node.destroy_node()
         rclpy.shutdown()
 
 
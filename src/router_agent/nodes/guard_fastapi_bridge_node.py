@@ -11,16 +11,46 @@ ROS2 Enhanced Guard → FastAPI Guard Service → Combined Decision → Response
 
 import rclpy
 from rclpy.node import Node
-from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup, ReentrantCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy, DurabilityPolicy
+from rclpy.duration import Duration
+from ament_index_python.packages import get_package_share_directory, PackageNotFoundError
 
-import requests
+import asyncio
+import httpx
+import itertools
 import json
+import os
+import random
 import time
 import threading
 import queue
-from typing import Dict, List, Optional, Any
+import yaml
+import numpy as np
+from typing import Dict, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    import h2
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 # ROS2 message imports
 from std_msgs.msg import Header, String
@@ -30,6 +60,65 @@ from elderly_companion.msg import (
 from elderly_companion.srv import ValidateIntent
 
 
+def json_dumps(data: Any) -> str:
+    """Serialize to a JSON string for std_msgs/String payloads."""
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def json_loads(raw) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Whether this IntentResult build carries a JSON 'parameters' field; checked
+# once here instead of with hasattr on every intent
+INTENT_HAS_PARAMETERS = hasattr(IntentResult, 'parameters')
+
+
+MSGPACK_HEADERS = {'Content-Type': 'application/msgpack', 'Accept': 'application/msgpack'}
+
+
+# Speech that is never coalesced away while the guard is busy. Includes the
+# guard's sos_keywords from config/guard.yml, which are merged in again at
+# startup in case they change
+EMERGENCY_SPEECH_KEYWORDS = ('救命', '紧急', '急救', 'help', 'emergency', '不舒服', '摔倒了', '救护车', '心口疼')
+
+# Only calm speech may be superseded in the latest-only slot; anything at or
+# above this stress level gets its own guard decision
+COALESCE_MAX_STRESS = 0.5
+
+
+def default_guard_config_path() -> str:
+    """Installed config/guard.yml of this package, or '' when not installed."""
+    try:
+        return os.path.join(get_package_share_directory('router_agent'), 'config', 'guard.yml')
+    except PackageNotFoundError:
+        return ''
+
+
+def load_emergency_keywords(guard_config_path: str) -> Tuple[str, ...]:
+    """EMERGENCY_SPEECH_KEYWORDS plus the guard's sos_keywords, lowercased."""
+    keywords = list(EMERGENCY_SPEECH_KEYWORDS)
+    if guard_config_path and os.path.exists(guard_config_path):
+        with open(guard_config_path, 'r', encoding='utf-8') as f:
+            keywords.extend((yaml.safe_load(f) or {}).get('sos_keywords', []))
+    return tuple(dict.fromkeys(k.lower() for k in keywords))
+
+
+# Decision latency ring buffer size; a power of two so the slot is an AND mask
+DECISION_TIMES_SIZE = 4096
+
+# Enhanced Guard counts as inactive after this long without an analysis
+ENHANCED_GUARD_STALE_NS = 60 * 1_000_000_000
+
+# p50/p95/p99 as fractions for the metrics snapshot
+PERCENTILE_FRACTIONS = np.array((0.50, 0.95, 0.99))
+
+
 class GuardDecisionType(Enum):
     """Types of guard decisions."""
     PASS_TEXT = "pass_text"
@@ -49,6 +138,146 @@ class GuardDecisionPriority(Enum):
     LOW = 5
 
 
+# Enum values bound once; decisions are built and compared per event
+DECISION_PASS_TEXT = GuardDecisionType.PASS_TEXT.value
+DECISION_WAKE = GuardDecisionType.WAKE.value
+DECISION_DISPATCH_EMERGENCY = GuardDecisionType.DISPATCH_EMERGENCY.value
+DECISION_DENY = GuardDecisionType.DENY.value
+DECISION_NEED_CONFIRM = GuardDecisionType.NEED_CONFIRM.value
+DECISION_ALLOW = GuardDecisionType.ALLOW.value
+
+# Decisions that block or gate an action
+SAFETY_DECISIONS = (DECISION_DENY, DECISION_NEED_CONFIRM)
+
+PRIORITY_EMERGENCY = GuardDecisionPriority.EMERGENCY.value
+PRIORITY_SAFETY_CRITICAL = GuardDecisionPriority.SAFETY_CRITICAL.value
+PRIORITY_NORMAL = GuardDecisionPriority.NORMAL.value
+PRIORITY_LOW = GuardDecisionPriority.LOW.value
+
+
+# Stand-in for a missing analysis section
+EMPTY_SECTION = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class GuardDecision:
+    """Enhanced Guard decision; slotted, and only turned into a dict where it leaves the rule path.
+    
+    Module-level instances are shared between analyses: derive changed
+    copies with dataclasses.replace instead of assigning to them.
+    """
+    decision: str
+    reason: str
+    priority: int = PRIORITY_LOW
+    confidence: float = 0.5
+    route: Optional[Tuple[str, ...]] = None
+    prompt: Optional[str] = None
+    implicit_command: Optional[Dict[str, Any]] = None
+    requires_confirmation: bool = False
+    fast_path: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Wire form of the decision, leaving out fields the rule did not set."""
+        result = {
+            'decision': self.decision,
+            'reason': self.reason,
+            'priority': self.priority,
+            'confidence': self.confidence
+        }
+        if self.route is not None:
+            result['route'] = self.route
+        if self.prompt is not None:
+            result['prompt'] = self.prompt
+        if self.implicit_command is not None:
+            result['implicit_command'] = self.implicit_command
+            result['requires_confirmation'] = self.requires_confirmation
+        if self.fast_path:
+            result['fast_path'] = True
+        return result
+
+
+# Emergency routes shared by every decision that dispatches them
+SOS_ROUTE = ('sip', 'family', 'doctor')
+SAFETY_EMERGENCY_ROUTE = ('sip', 'family')
+
+# Flyweight decisions for outcomes that never vary with the analysis
+SAFETY_EMERGENCY_DECISION = GuardDecision(
+    decision=DECISION_DISPATCH_EMERGENCY,
+    route=SAFETY_EMERGENCY_ROUTE,
+    reason='enhanced_guard_safety_emergency',
+    priority=PRIORITY_EMERGENCY,
+    confidence=0.85
+)
+HIGH_RISK_DECISION = GuardDecision(
+    decision=DECISION_NEED_CONFIRM,
+    reason='enhanced_guard_high_risk',
+    prompt='检测到可能的安全风险，请确认您是否需要帮助？',
+    priority=PRIORITY_SAFETY_CRITICAL,
+    confidence=0.7
+)
+NO_TRIGGER_DECISION = GuardDecision(decision=DECISION_PASS_TEXT, reason='enhanced_guard_no_trigger')
+
+
+# Enhanced Guard analysis rules. Each predicate and builder takes the
+# (sos_detection, safety_assessment, wakeword, implicit_command) sections
+def is_sos_emergency(sos, safety, wakeword, implicit) -> bool:
+    return bool(sos.get('detected')) and sos.get('urgency_level', 0) >= 3
+
+
+def build_sos_decision(sos, safety, wakeword, implicit) -> GuardDecision:
+    return GuardDecision(
+        decision=DECISION_DISPATCH_EMERGENCY,
+        route=SOS_ROUTE,
+        reason=f"enhanced_guard_sos_{sos.get('category', 'unknown')}",
+        priority=PRIORITY_EMERGENCY,
+        confidence=sos.get('confidence', 0.9)
+    )
+
+
+def is_safety_emergency(sos, safety, wakeword, implicit) -> bool:
+    return safety.get('level') == 'emergency'
+
+
+def build_safety_emergency_decision(sos, safety, wakeword, implicit) -> GuardDecision:
+    return SAFETY_EMERGENCY_DECISION
+
+
+def is_emergency_wakeword(sos, safety, wakeword, implicit) -> bool:
+    return bool(wakeword.get('detected')) and wakeword.get('type') == 'emergency'
+
+
+def build_wakeword_decision(sos, safety, wakeword, implicit) -> GuardDecision:
+    return GuardDecision(
+        decision=DECISION_WAKE,
+        reason=f"enhanced_guard_wakeword_{wakeword.get('type')}",
+        priority=PRIORITY_SAFETY_CRITICAL,
+        confidence=wakeword.get('confidence', 0.8)
+    )
+
+
+def is_high_risk(sos, safety, wakeword, implicit) -> bool:
+    return safety.get('level') == 'high_risk'
+
+
+def build_high_risk_decision(sos, safety, wakeword, implicit) -> GuardDecision:
+    return HIGH_RISK_DECISION
+
+
+def is_confident_implicit_command(sos, safety, wakeword, implicit) -> bool:
+    return bool(implicit.get('detected')) and implicit.get('confidence', 0) > 0.7
+
+
+def build_implicit_command_decision(sos, safety, wakeword, implicit) -> GuardDecision:
+    return GuardDecision(
+        decision=DECISION_ALLOW,
+        reason=f"enhanced_guard_implicit_{implicit.get('command_type')}",
+        implicit_command=implicit,
+        requires_confirmation=implicit.get('requires_confirmation', False),
+        priority=PRIORITY_NORMAL,
+        confidence=implicit.get('confidence', 0.7)
+    )
+
+
 class GuardFastAPIBridgeNode(Node):
     """
     Bridge Node integrating Enhanced Guard Engine with FastAPI Guard Service.
@@ -63,6 +292,11 @@ class GuardFastAPIBridgeNode(Node):
     - Provides unified guard decision API
     - Emergency response coordination
     - Performance monitoring and logging
+    
+    Freshness contract: each /guard/analysis replaces last_enhanced_analysis,
+    so decisions only read the newest one. The subscription is still RELIABLE
+    with a 10-deep queue, so an analysis carrying an emergency level reaches
+    the emergency check even when newer analyses arrive right behind it.
     """
 
     def __init__(self):
@@ -74,9 +308,18 @@ class GuardFastAPIBridgeNode(Node):
             parameters=[
                 # FastAPI Guard Service
                 ('fastapi.guard_url', 'http://localhost:7002'),
+                ('fastapi.transport', 'tcp'),  # 'tcp' or 'uds'
+                ('fastapi.guard_socket', '/run/elderly/guard.sock'),
+                ('fastapi.wire_format', 'json'),  # 'json' or 'msgpack'
                 ('fastapi.timeout_seconds', 5.0),
                 ('fastapi.retry_attempts', 3),
+                ('fastapi.retry_base_seconds', 0.05),
+                ('fastapi.retry_cap_seconds', 1.0),
+                ('fastapi.breaker_failure_threshold', 3),
+                ('fastapi.breaker_initial_backoff_seconds', 1.0),
+                ('fastapi.breaker_max_backoff_seconds', 30.0),
                 ('fastapi.enable_fallback', True),
+                ('guard.config_path', ''),  # '' uses the installed config/guard.yml
                 
                 # Enhanced Guard Integration
                 ('enhanced_guard.enable_wakeword_enhancement', True),
@@ -94,6 +337,8 @@ class GuardFastAPIBridgeNode(Node):
                 ('monitoring.log_all_decisions', True),
                 ('monitoring.performance_tracking', True),
                 ('monitoring.alert_slow_decisions', True),
+                ('monitoring.metrics_period_seconds', 1.0),
+                ('monitoring.health_check_period_seconds', 30.0),
                 ('performance.max_decision_time_ms', 200),
                 
                 # Safety Configuration
@@ -105,8 +350,16 @@ class GuardFastAPIBridgeNode(Node):
         
         # Get parameters
         self.fastapi_guard_url = self.get_parameter('fastapi.guard_url').value
+        self.transport = self.get_parameter('fastapi.transport').value
+        self.guard_socket = self.get_parameter('fastapi.guard_socket').value
+        self.use_msgpack = self.get_parameter('fastapi.wire_format').value == 'msgpack'
         self.fastapi_timeout = self.get_parameter('fastapi.timeout_seconds').value
         self.retry_attempts = self.get_parameter('fastapi.retry_attempts').value
+        self.retry_base = self.get_parameter('fastapi.retry_base_seconds').value
+        self.retry_cap = self.get_parameter('fastapi.retry_cap_seconds').value
+        self.breaker_failure_threshold = self.get_parameter('fastapi.breaker_failure_threshold').value
+        self.breaker_initial_backoff = self.get_parameter('fastapi.breaker_initial_backoff_seconds').value
+        self.breaker_max_backoff = self.get_parameter('fastapi.breaker_max_backoff_seconds').value
         self.enable_wakeword_enhancement = self.get_parameter('enhanced_guard.enable_wakeword_enhancement').value
         self.enable_sos_enhancement = self.get_parameter('enhanced_guard.enable_sos_enhancement').value
         self.enable_implicit_commands = self.get_parameter('enhanced_guard.enable_implicit_commands').value
@@ -114,29 +367,102 @@ class GuardFastAPIBridgeNode(Node):
         self.fastapi_weight = self.get_parameter('decision.fastapi_guard_weight').value
         self.emergency_threshold = self.get_parameter('decision.emergency_override_threshold').value
         self.max_decision_time = self.get_parameter('performance.max_decision_time_ms').value
+        self.alert_slow_decisions = self.get_parameter('monitoring.alert_slow_decisions').value
+        self.metrics_period = self.get_parameter('monitoring.metrics_period_seconds').value
+        self.health_check_period = self.get_parameter('monitoring.health_check_period_seconds').value
         self.emergency_response_time = self.get_parameter('safety.emergency_response_time_ms').value
+        self.emergency_response_time_ns = int(self.emergency_response_time * 1_000_000)
+        
+        # Urgency keywords shared with the FastAPI guard's SOS check
+        guard_config_path = self.get_parameter('guard.config_path').value or default_guard_config_path()
+        try:
+            self.emergency_keywords = load_emergency_keywords(guard_config_path)
+        except Exception as e:
+            self.get_logger().error(f"Guard config load error, using built-in emergency keywords: {e}")
+            self.emergency_keywords = EMERGENCY_SPEECH_KEYWORDS
+        
+        # Enhanced Guard analysis rules in descending priority; disabled
+        # features are left out once here rather than re-checked per call
+        self.analysis_rules = [
+            (is_sos_emergency, build_sos_decision),
+            (is_safety_emergency, build_safety_emergency_decision),
+        ]
+        if self.enable_wakeword_enhancement:
+            self.analysis_rules.append((is_emergency_wakeword, build_wakeword_decision))
+        self.analysis_rules.append((is_high_risk, build_high_risk_decision))
+        if self.enable_implicit_commands:
+            self.analysis_rules.append((is_confident_implicit_command, build_implicit_command_decision))
         
         # Integration state
         self.enhanced_guard_available = False
         self.fastapi_guard_available = False
-        self.last_enhanced_analysis: Optional[Dict[str, Any]] = None
+        # FastAPI guard circuit breaker: opens after consecutive failures and
+        # half-opens after a backoff that doubles on every failed probe
+        self.guard_consecutive_failures = 0
+        self.guard_breaker_open_until = 0.0
+        self.guard_breaker_backoff = self.breaker_initial_backoff
+        # Newest /guard/analysis as (raw JSON, parsed dict or None, analysis_id);
+        # parsed lazily by last_enhanced_analysis so unread analyses cost no decode
+        self.enhanced_analysis_state = (None, None, 0)
+        self.analysis_lock = threading.Lock()
+        # monotonic_ns receive time of the newest analysis, for freshness checks
+        self.last_analysis_ns = 0
+        self.analysis_counter = itertools.count(1)
+        self.published_analysis_id = 0
         
-        # Performance tracking
-        self.decision_times = []
+        # Performance tracking: preallocated ring of recent decision latencies.
+        # Only the bridge event loop writes it, so the counter needs no lock
+        self.decision_times = np.zeros(DECISION_TIMES_SIZE, dtype=np.float32)
+        self.decision_count = 0
         self.decision_stats = {
             'total_decisions': 0,
             'emergency_decisions': 0,
             'enhanced_guard_decisions': 0,
             'fastapi_only_decisions': 0,
-            'combined_decisions': 0
+            'combined_decisions': 0,
+            'fast_path_emergencies': 0
         }
         
-        # HTTP session for FastAPI communication
-        self.fastapi_session = requests.Session()
-        self.fastapi_session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'Guard-FastAPI-Bridge/1.0'
-        })
+        # Guard HTTP runs on a dedicated event loop thread so ROS callbacks
+        # return immediately and concurrent decisions overlap in flight
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        
+        # Latest-only speech slot, owned by the event loop: while a decision is
+        # in flight a newer utterance replaces the waiting one, so the guard
+        # never works through a stale backlog. Urgent speech bypasses the slot
+        # as its own task, kept referenced until done so it is not collected
+        self.latest_speech = None
+        self.speech_ready = asyncio.Event()
+        self.urgent_speech_tasks = set()
+        
+        if self.use_msgpack and not HAS_MSGPACK:
+            self.get_logger().warning("fastapi.wire_format is msgpack but msgpack is not installed, using JSON")
+            self.use_msgpack = False
+        
+        # The guard URL still supplies the Host header when calls go over UDS
+        guard_check_path = '/guard/check/msgpack' if self.use_msgpack else '/guard/check'
+        self.guard_endpoint = f"{self.fastapi_guard_url}{guard_check_path}"
+        self.guard_health_url = f"{self.fastapi_guard_url}/health"
+        
+        # Pooled keep-alive client for FastAPI communication, so guard calls
+        # reuse connections instead of handshaking. A co-located guard can be
+        # reached over its Unix domain socket, skipping the loopback TCP
+        # stack; over TCP, HTTP/2 is used when h2 is installed
+        guard_limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+        if self.transport == 'uds' and self.guard_socket:
+            guard_transport = httpx.AsyncHTTPTransport(uds=self.guard_socket, limits=guard_limits)
+        else:
+            guard_transport = httpx.AsyncHTTPTransport(http2=HAS_HTTP2, limits=guard_limits)
+        self.fastapi_session = httpx.AsyncClient(
+            transport=guard_transport,
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'Guard-FastAPI-Bridge/1.0'
+            },
+            timeout=self.fastapi_timeout
+        )
         
         # QoS profiles
         critical_qos = QoSProfile(
@@ -145,32 +471,53 @@ class GuardFastAPIBridgeNode(Node):
             depth=100
         )
         
-        fast_qos = QoSProfile(
-            reliability=ReliabilityPolicy.BEST_EFFORT,
+        # Speech and intents are handed straight to the bridge loop by their
+        # callbacks, so only a short burst can ever queue in the middleware
+        input_qos = QoSProfile(
+            reliability=ReliabilityPolicy.RELIABLE,
+            history=HistoryPolicy.KEEP_LAST,
+            depth=10
+        )
+        
+        # RELIABLE with a small backlog: an analysis can carry an emergency
+        # level that triggers handle_immediate_emergency, so a burst of newer
+        # analyses must not overwrite one that has not been handled yet
+        analysis_qos = QoSProfile(
+            reliability=ReliabilityPolicy.RELIABLE,
             history=HistoryPolicy.KEEP_LAST,
-            depth=1
+            depth=10
         )
         
+        # SOS, analysis and speech callbacks may run concurrently under the
+        # MultiThreadedExecutor, so an SOS alert never queues behind them
+        self.critical_callback_group = ReentrantCallbackGroup()
+        # Monitoring timers get groups of their own, so a slow health probe
+        # blocks neither intents, the validate service nor the 1 Hz metrics
+        self.metrics_callback_group = MutuallyExclusiveCallbackGroup()
+        self.health_callback_group = MutuallyExclusiveCallbackGroup()
+        
         # Subscribers - Enhanced Guard outputs
         self.guard_analysis_sub = self.create_subscription(
             String,
             '/guard/analysis',
             self.handle_enhanced_guard_analysis,
-            critical_qos
+            analysis_qos,
+            callback_group=self.critical_callback_group
         )
         
         self.sos_alert_sub = self.create_subscription(
             EmergencyAlert,
             '/guard/sos_alert',
             self.handle_sos_alert,
-            critical_qos
+            critical_qos,
+            callback_group=self.critical_callback_group
         )
         
         self.enhanced_intent_sub = self.create_subscription(
             IntentResult,
             '/guard/enhanced_intent',
             self.handle_enhanced_intent,
-            critical_qos
+            input_qos
         )
         
         # Subscribers - Input for guard processing
@@ -178,7 +525,8 @@ class GuardFastAPIBridgeNode(Node):
             SpeechResult,
             '/speech/recognized',
             self.handle_speech_for_guard,
-            critical_qos
+            input_qos,
+            callback_group=self.critical_callback_group
         )
         
         # Publishers - Guard outputs
@@ -188,10 +536,33 @@ class GuardFastAPIBridgeNode(Node):
             critical_qos
         )
         
+        # Metrics go out as one snapshot per period; the deadline lets
+        # subscribers detect a stalled bridge
+        metrics_qos = QoSProfile(
+            reliability=ReliabilityPolicy.BEST_EFFORT,
+            history=HistoryPolicy.KEEP_LAST,
+            depth=1,
+            deadline=Duration(seconds=2.0 * self.metrics_period)
+        )
         self.guard_metrics_pub = self.create_publisher(
             String,
             '/guard/performance_metrics',
-            fast_qos
+            metrics_qos
+        )
+        self.metrics_msg = String()
+        
+        # Decisions carry only an analysis summary; the full analysis behind
+        # them is latched here under its analysis_id for audit consumers
+        audit_qos = QoSProfile(
+            reliability=ReliabilityPolicy.RELIABLE,
+            durability=DurabilityPolicy.TRANSIENT_LOCAL,
+            history=HistoryPolicy.KEEP_LAST,
+            depth=10
+        )
+        self.analysis_full_pub = self.create_publisher(
+            String,
+            '/guard/analysis_full',
+            audit_qos
         )
         
         # Services
@@ -201,48 +572,132 @@ class GuardFastAPIBridgeNode(Node):
             self.validate_intent_callback
         )
         
-        # Test FastAPI guard availability
+        # Speech decisions are dispatched from the loop as the slot fills
+        self.submit_coroutine(self.speech_dispatch_loop())
+        
+        # Test FastAPI guard availability; also pre-warms the connection pool
         self.test_fastapi_guard_availability()
         
-        # Start monitoring threads
-        self.start_monitoring_threads()
+        # Start monitoring timers
+        self.start_monitoring_timers()
         
         self.get_logger().info("Guard-FastAPI Bridge Node initialized - Integrated guard system ready")
 
+    def run_coroutine(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the bridge event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def submit_coroutine(self, coro):
+        """Schedule a coroutine on the bridge event loop without waiting, logging failures."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(self.log_coroutine_failure)
+        return future
+
+    def log_coroutine_failure(self, future):
+        """Report exceptions from fire-and-forget coroutines."""
+        if not future.cancelled() and future.exception() is not None:
+            self.get_logger().error(f"Guard bridge task error: {future.exception()}")
+
     def test_fastapi_guard_availability(self):
         """Test FastAPI guard service availability."""
         try:
-            health_url = f"{self.fastapi_guard_url}/health"
-            response = self.fastapi_session.get(health_url, timeout=5)
+            response = self.run_coroutine(self.fastapi_session.get(self.guard_health_url, timeout=5))
             
             if response.status_code == 200:
-                self.fastapi_guard_available = True
+                self.record_guard_outcome(True)
                 self.get_logger().info("✅ FastAPI Guard service available")
             else:
-                self.fastapi_guard_available = False
+                self.trip_guard_breaker()
                 self.get_logger().warning("⚠️ FastAPI Guard service not responding properly")
                 
         except Exception as e:
-            self.fastapi_guard_available = False
+            self.trip_guard_breaker()
             self.get_logger().warning(f"❌ FastAPI Guard service unavailable: {e}")
 
+    def guard_call_permitted(self) -> bool:
+        """Whether the FastAPI guard breaker lets a call (or half-open probe) through."""
+        return time.monotonic() >= self.guard_breaker_open_until
+
+    def record_guard_outcome(self, succeeded: bool):
+        """Track a FastAPI guard call and open the breaker after consecutive failures."""
+        if succeeded:
+            if self.guard_consecutive_failures >= self.breaker_failure_threshold:
+                self.get_logger().info("FastAPI Guard recovered, closing circuit breaker")
+            self.guard_consecutive_failures = 0
+            self.guard_breaker_backoff = self.breaker_initial_backoff
+            self.fastapi_guard_available = True
+            return
+        
+        self.guard_consecutive_failures += 1
+        # Past the threshold every failure is a failed half-open probe
+        if self.guard_consecutive_failures >= self.breaker_failure_threshold:
+            self.trip_guard_breaker()
+
+    def trip_guard_breaker(self):
+        """Open the FastAPI guard breaker for the current backoff, then double it."""
+        self.fastapi_guard_available = False
+        self.guard_breaker_open_until = time.monotonic() + self.guard_breaker_backoff
+        self.get_logger().warning(
+            f"FastAPI Guard circuit open for {self.guard_breaker_backoff:.1f}s"
+        )
+        self.guard_breaker_backoff = min(self.guard_breaker_backoff * 2, self.breaker_max_backoff)
+
     def handle_enhanced_guard_analysis(self, msg: String):
         """Handle comprehensive analysis from Enhanced Guard Engine."""
+        with self.analysis_lock:
+            self.enhanced_analysis_state = (msg.data, None, next(self.analysis_counter))
+        self.last_analysis_ns = time.monotonic_ns()
+        self.enhanced_guard_available = True
+        
+        # Check for immediate emergency conditions; only an analysis that
+        # mentions 'emergency' at all can qualify, so others stay unparsed
+        if 'emergency' not in msg.data:
+            return
         try:
-            analysis = json.loads(msg.data)
-            self.last_enhanced_analysis = analysis
-            self.enhanced_guard_available = True
-            
-            self.get_logger().debug(f"Enhanced Guard analysis received: {analysis.get('safety_assessment', {}).get('level', 'unknown')}")
-            
-            # Check for immediate emergency conditions
-            safety_assessment = analysis.get('safety_assessment', {})
-            if safety_assessment.get('level') == 'emergency':
+            analysis = self.last_enhanced_analysis
+            if analysis and (analysis.get('safety_assessment') or EMPTY_SECTION).get('level') == 'emergency':
                 self.handle_immediate_emergency(analysis)
-                
-        except Exception as e:
+        except (AttributeError, TypeError, ValueError) as e:
+            # Malformed analysis, e.g. non-object JSON or a section that is not an object
             self.get_logger().error(f"Enhanced guard analysis handling error: {e}")
 
+    @property
+    def last_enhanced_analysis(self) -> Optional[Dict[str, Any]]:
+        """Newest Enhanced Guard analysis, decoded on first use."""
+        raw, analysis, analysis_id = self.enhanced_analysis_state
+        if analysis is None and raw is not None:
+            try:
+                analysis = json_loads(raw)
+            except ValueError as e:
+                self.get_logger().error(f"Enhanced guard analysis decode error: {e}")
+                return None
+            analysis['analysis_id'] = analysis_id
+            # Keep the decode unless a newer analysis arrived meanwhile
+            with self.analysis_lock:
+                if self.enhanced_analysis_state[0] is raw:
+                    self.enhanced_analysis_state = (raw, analysis, analysis_id)
+        return analysis
+
+    def summarize_analysis(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact analysis reference for decisions; latches the full analysis once per id."""
+        analysis_id = analysis.get('analysis_id', 0)
+        if analysis_id != self.published_analysis_id:
+            self.published_analysis_id = analysis_id
+            full_msg = String()
+            full_msg.data = json_dumps(analysis)
+            self.analysis_full_pub.publish(full_msg)
+        
+        safety = analysis.get('safety_assessment') or EMPTY_SECTION
+        return {
+            'analysis_id': analysis_id,
+            'level': safety.get('level'),
+            'risk_score': safety.get('risk_score'),
+            'sos_category': (analysis.get('sos_detection') or EMPTY_SECTION).get('category'),
+            'wake_type': (analysis.get('wakeword') or EMPTY_SECTION).get('type'),
+            'implicit_type': (analysis.get('implicit_command') or EMPTY_SECTION).get('command_type'),
+            'timestamp': analysis.get('timestamp')
+        }
+
     def handle_sos_alert(self, msg: EmergencyAlert):
         """Handle SOS alerts from Enhanced Guard."""
         try:
@@ -250,12 +705,11 @@ class GuardFastAPIBridgeNode(Node):
             
             # Create emergency decision immediately
             emergency_decision = {
-                'decision': GuardDecisionType.DISPATCH_EMERGENCY.value,
+                'decision': DECISION_DISPATCH_EMERGENCY,
                 'route': ['sip', 'family', 'doctor'],
                 'reason': f'enhanced_guard_sos_{msg.emergency_type}',
                 'urgency_level': msg.severity_level,
                 'enhanced_guard_triggered': True,
-                'timestamp': datetime.now().isoformat(),
                 'emergency_id': getattr(msg, 'incident_id', str(time.time()))
             }
             
@@ -274,28 +728,67 @@ class GuardFastAPIBridgeNode(Node):
             self.get_logger().info(f"Enhanced intent from Guard: {msg.intent_type}")
             
             # Process the enhanced intent through combined guard logic
-            self.process_enhanced_intent_with_fastapi(msg)
+            self.submit_coroutine(self.process_enhanced_intent_with_fastapi(msg))
             
         except Exception as e:
             self.get_logger().error(f"Enhanced intent handling error: {e}")
 
     def handle_speech_for_guard(self, msg: SpeechResult):
         """Handle speech input for comprehensive guard processing."""
+        self.get_logger().info(f"Processing speech for guard: '{msg.text}'")
+        
+        # Hand off to the bridge loop; the subscription callback returns at once
+        try:
+            self.loop.call_soon_threadsafe(self.offer_speech, msg, time.monotonic_ns())
+        except RuntimeError as e:
+            # Bridge loop already closed during shutdown
+            self.get_logger().error(f"Speech guard processing error: {e}")
+
+    def is_urgent_speech(self, msg: SpeechResult) -> bool:
+        """Cheap check for speech that must get its own guard decision.
+        
+        Only calm speech with no emergency keyword counts as non-urgent and
+        may be superseded in the latest-only slot.
+        """
+        text = msg.text.lower()
+        return msg.emotion.stress_level >= COALESCE_MAX_STRESS or any(k in text for k in self.emergency_keywords)
+
+    def offer_speech(self, msg: SpeechResult, received_at: int):
+        """Put speech in the latest-only slot on the event loop, or dispatch it now if urgent."""
+        if self.is_urgent_speech(msg):
+            task = self.loop.create_task(self.decide_speech_guard(msg, received_at))
+            self.urgent_speech_tasks.add(task)
+            task.add_done_callback(self.urgent_speech_tasks.discard)
+            return
+        
+        if self.latest_speech is not None:
+            self.get_logger().debug(f"Superseded pending speech: '{self.latest_speech[0].text}'")
+        self.latest_speech = (msg, received_at)
+        self.speech_ready.set()
+
+    async def speech_dispatch_loop(self):
+        """Decide the newest waiting utterance, one at a time."""
+        while True:
+            await self.speech_ready.wait()
+            self.speech_ready.clear()
+            msg, received_at = self.latest_speech
+            self.latest_speech = None
+            await self.decide_speech_guard(msg, received_at)
+
+    async def decide_speech_guard(self, msg: SpeechResult, start_ns: int):
+        """Produce, publish and time the combined guard decision for one utterance."""
         try:
-            start_time = time.time()
-            
-            self.get_logger().info(f"Processing speech for guard: '{msg.text}'")
-            
             # Process through both Enhanced Guard and FastAPI Guard
-            combined_decision = self.process_speech_with_combined_guard(msg)
+            combined_decision = await self.process_speech_with_combined_guard(msg)
             
             if combined_decision:
                 # Publish final decision
                 self.publish_guard_decision(combined_decision)
                 
                 # Track performance
-                decision_time = (time.time() - start_time) * 1000  # ms
-                self.decision_times.append(decision_time)
+                decision_time = (time.monotonic_ns() - start_ns) / 1_000_000  # ms
+                self.decision_times[self.decision_count & (DECISION_TIMES_SIZE - 1)] = decision_time
+                self.decision_count += 1
                 
                 if decision_time > self.max_decision_time:
                     self.get_logger().warning(f"Guard decision time exceeded: {decision_time:.1f}ms")
@@ -306,28 +799,48 @@ class GuardFastAPIBridgeNode(Node):
         except Exception as e:
             self.get_logger().error(f"Speech guard processing error: {e}")
 
-    def process_speech_with_combined_guard(self, speech_msg: SpeechResult) -> Optional[Dict[str, Any]]:
-        """Process speech through both Enhanced Guard and FastAPI Guard."""
+    async def process_speech_with_combined_guard(self, speech_msg: SpeechResult) -> Optional[Dict[str, Any]]:
+        """Process speech through both Enhanced Guard and FastAPI Guard.
+        
+        The decision helpers below carry no exception handling of their own;
+        any failure in them surfaces here and becomes a pass_text fallback.
+        """
         try:
             enhanced_analysis = self.last_enhanced_analysis
+            enhanced_decision = None
             fastapi_decision = None
             
-            # Get FastAPI guard decision
-            if self.fastapi_guard_available:
-                fastapi_decision = self.call_fastapi_guard_asr(speech_msg.text)
+            # An Enhanced Guard emergency overrides any FastAPI answer in
+            # merge_decisions, so don't wait on the round trip for it
+            if enhanced_analysis:
+                enhanced_decision = self.interpret_enhanced_guard_analysis(enhanced_analysis)
+                if enhanced_decision.decision == DECISION_DISPATCH_EMERGENCY:
+                    self.decision_stats['fast_path_emergencies'] += 1
+                    enhanced_decision = replace(enhanced_decision, fast_path=True)
+                    return self.combine_guard_decisions(
+                        speech_msg, enhanced_analysis, None, enhanced_decision
+                    )
+            
+            # Get FastAPI guard decision; skipped outright while the breaker is open
+            if self.guard_call_permitted():
+                fastapi_decision = await self.call_fastapi_guard_asr(speech_msg.text)
                 
             # Combine decisions
             combined_decision = self.combine_guard_decisions(
-                speech_msg, enhanced_analysis, fastapi_decision
+                speech_msg, enhanced_analysis, fastapi_decision, enhanced_decision
             )
             
             return combined_decision
             
         except Exception as e:
             self.get_logger().error(f"Combined guard processing error: {e}")
-            return None
+            return {
+                'decision': DECISION_PASS_TEXT,
+                'reason': 'decision_combination_error',
+                'error': str(e)
+            }
 
-    def process_enhanced_intent_with_fastapi(self, intent_msg: IntentResult):
+    async def process_enhanced_intent_with_fastapi(self, intent_msg: IntentResult):
         """Process enhanced intent through FastAPI guard."""
         try:
             # Convert ROS2 IntentResult to dict format expected by FastAPI
@@ -339,16 +852,17 @@ class GuardFastAPIBridgeNode(Node):
             }
             
             # Add any additional parameters from the intent
-            if hasattr(intent_msg, 'parameters'):
-                intent_dict.update(json.loads(intent_msg.parameters))
+            if INTENT_HAS_PARAMETERS and intent_msg.parameters:
+                intent_dict.update(json_loads(intent_msg.parameters))
             
             # Get FastAPI guard decision for intent
-            fastapi_decision = self.call_fastapi_guard_intent(intent_dict)
+            fastapi_decision = await self.call_fastapi_guard_intent(intent_dict)
             
             # Combine with enhanced guard analysis
-            if self.last_enhanced_analysis:
+            enhanced_analysis = self.last_enhanced_analysis
+            if enhanced_analysis:
                 combined_decision = self.combine_intent_decisions(
-                    intent_msg, self.last_enhanced_analysis, fastapi_decision
+                    intent_msg, enhanced_analysis, fastapi_decision
                 )
                 
                 if combined_decision:
@@ -357,262 +871,203 @@ class GuardFastAPIBridgeNode(Node):
         except Exception as e:
             self.get_logger().error(f"Enhanced intent FastAPI processing error: {e}")
 
-    def call_fastapi_guard_asr(self, text: str) -> Optional[Dict[str, Any]]:
+    def encode_guard_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Request body keyword arguments in the configured wire format."""
+        if self.use_msgpack:
+            return {'content': msgpack.packb(request_data), 'headers': MSGPACK_HEADERS}
+        return {'json': request_data}
+
+    def decode_guard_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a guard reply in the configured wire format."""
+        if self.use_msgpack:
+            return msgpack.unpackb(response.content)
+        return response.json()
+
+    async def call_fastapi_guard_asr(self, text: str) -> Optional[Dict[str, Any]]:
         """Call FastAPI guard service for ASR text."""
         try:
-            guard_endpoint = f"{self.fastapi_guard_url}/guard/check"
-            
-            request_data = {
+            request_body = self.encode_guard_request({
                 "type": "asr",
                 "text": text
-            }
+            })
+            
+            # All attempts and backoff share one fastapi_timeout budget
+            deadline = time.monotonic() + self.fastapi_timeout
+            delay = self.retry_base
             
             for attempt in range(self.retry_attempts):
                 try:
-                    response = self.fastapi_session.post(
-                        guard_endpoint,
-                        json=request_data,
-                        timeout=self.fastapi_timeout
+                    response = await self.fastapi_session.post(
+                        self.guard_endpoint,
+                        timeout=max(deadline - time.monotonic(), 0.001),
+                        **request_body
                     )
                     
                     if response.status_code == 200:
-                        decision = response.json()
+                        decision = self.decode_guard_response(response)
                         self.get_logger().debug(f"FastAPI guard ASR decision: {decision}")
+                        self.record_guard_outcome(True)
                         return decision
                     else:
                         self.get_logger().warning(f"FastAPI guard returned {response.status_code}")
                         
-                except requests.exceptions.Timeout:
+                except httpx.TimeoutException:
                     self.get_logger().warning(f"FastAPI guard timeout (attempt {attempt + 1})")
                 except Exception as e:
                     self.get_logger().error(f"FastAPI guard error (attempt {attempt + 1}): {e}")
                 
                 if attempt < self.retry_attempts - 1:
-                    time.sleep(0.2 * (attempt + 1))
+                    # Decorrelated jitter keeps bridges from retrying in lockstep
+                    delay = min(self.retry_cap, random.uniform(self.retry_base, delay * 3))
+                    if time.monotonic() + delay >= deadline:
+                        break
+                    await asyncio.sleep(delay)
             
+            self.record_guard_outcome(False)
             return None
             
         except Exception as e:
             self.get_logger().error(f"FastAPI guard ASR call error: {e}")
             return None
 
-    def call_fastapi_guard_intent(self, intent_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def call_fastapi_guard_intent(self, intent_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Call FastAPI guard service for intent validation."""
+        if not self.guard_call_permitted():
+            return None
+        
         try:
-            guard_endpoint = f"{self.fastapi_guard_url}/guard/check"
-            
-            request_data = {
+            request_body = self.encode_guard_request({
                 "type": "intent",
                 "intent": intent_dict
-            }
+            })
             
-            response = self.fastapi_session.post(
-                guard_endpoint,
-                json=request_data,
-                timeout=self.fastapi_timeout
+            response = await self.fastapi_session.post(
+                self.guard_endpoint,
+                timeout=self.fastapi_timeout,
+                **request_body
             )
             
             if response.status_code == 200:
-                decision = response.json()
+                decision = self.decode_guard_response(response)
                 self.get_logger().debug(f"FastAPI guard intent decision: {decision}")
+                self.record_guard_outcome(True)
                 return decision
             else:
                 self.get_logger().warning(f"FastAPI guard intent returned {response.status_code}")
+                self.record_guard_outcome(False)
                 return None
                 
         except Exception as e:
             self.get_logger().error(f"FastAPI guard intent call error: {e}")
+            self.record_guard_outcome(False)
             return None
 
     def combine_guard_decisions(self, speech_msg: SpeechResult, 
                               enhanced_analysis: Optional[Dict[str, Any]],
-                              fastapi_decision: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                              fastapi_decision: Optional[Dict[str, Any]],
+                              enhanced_decision: Optional[GuardDecision] = None) -> Dict[str, Any]:
         """Combine decisions from Enhanced Guard and FastAPI Guard."""
-        try:
-            # Start with FastAPI decision as base (proven functionality)
-            if fastapi_decision:
-                combined_decision = fastapi_decision.copy()
-                combined_decision['fastapi_decision'] = fastapi_decision
-                self.decision_stats['fastapi_only_decisions'] += 1
-            else:
-                # Fallback decision if FastAPI not available
-                combined_decision = {
-                    'decision': 'pass_text',
-                    'reason': 'fastapi_unavailable_fallback'
-                }
-            
-            # Enhance with Enhanced Guard analysis
-            if enhanced_analysis:
+        # Start with FastAPI decision as base (proven functionality)
+        if fastapi_decision:
+            combined_decision = fastapi_decision | {'fastapi_decision': fastapi_decision}
+            self.decision_stats['fastapi_only_decisions'] += 1
+        else:
+            # Fallback decision if FastAPI not available
+            combined_decision = {
+                'decision': DECISION_PASS_TEXT,
+                'reason': 'fastapi_unavailable_fallback'
+            }
+        
+        # Enhance with Enhanced Guard analysis
+        if enhanced_analysis:
+            if enhanced_decision is None:
                 enhanced_decision = self.interpret_enhanced_guard_analysis(enhanced_analysis)
-                combined_decision = self.merge_decisions(combined_decision, enhanced_decision, enhanced_analysis)
-                combined_decision['enhanced_analysis'] = enhanced_analysis
-                self.decision_stats['enhanced_guard_decisions'] += 1
-                
-                if fastapi_decision:
-                    self.decision_stats['combined_decisions'] += 1
-            
-            # Add metadata
-            combined_decision.update({
-                'timestamp': datetime.now().isoformat(),
-                'speech_text': speech_msg.text,
-                'speech_confidence': speech_msg.confidence,
-                'processing_mode': 'combined' if enhanced_analysis and fastapi_decision else 'single',
-                'bridge_version': '1.0'
-            })
-            
-            return combined_decision
+            combined_decision = self.merge_decisions(combined_decision, enhanced_decision, enhanced_analysis)
+            combined_decision['enhanced_analysis_summary'] = self.summarize_analysis(enhanced_analysis)
+            self.decision_stats['enhanced_guard_decisions'] += 1
             
-        except Exception as e:
-            self.get_logger().error(f"Guard decision combination error: {e}")
-            return {
-                'decision': 'pass_text',
-                'reason': 'decision_combination_error',
-                'error': str(e)
-            }
+            if fastapi_decision:
+                self.decision_stats['combined_decisions'] += 1
+        
+        # Add metadata
+        combined_decision.update({
+            'timestamp': datetime.now().isoformat(),
+            'speech_text': speech_msg.text,
+            'speech_confidence': speech_msg.confidence,
+            'processing_mode': 'combined' if enhanced_analysis and fastapi_decision else 'single',
+            'bridge_version': '1.0'
+        })
+        
+        return combined_decision
 
-    def interpret_enhanced_guard_analysis(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def interpret_enhanced_guard_analysis(self, analysis: Dict[str, Any]) -> GuardDecision:
         """Interpret Enhanced Guard analysis into decision format."""
-        try:
-            safety_assessment = analysis.get('safety_assessment', {})
-            sos_detection = analysis.get('sos_detection', {})
-            wakeword = analysis.get('wakeword', {})
-            implicit_command = analysis.get('implicit_command', {})
-            
-            # Priority 1: Emergency SOS
-            if sos_detection.get('detected') and sos_detection.get('urgency_level', 0) >= 3:
-                return {
-                    'decision': GuardDecisionType.DISPATCH_EMERGENCY.value,
-                    'route': ['sip', 'family', 'doctor'],
-                    'reason': f"enhanced_guard_sos_{sos_detection.get('category', 'unknown')}",
-                    'priority': GuardDecisionPriority.EMERGENCY.value,
-                    'confidence': sos_detection.get('confidence', 0.9)
-                }
-            
-            # Priority 2: Safety critical conditions
-            if safety_assessment.get('level') == 'emergency':
-                return {
-                    'decision': GuardDecisionType.DISPATCH_EMERGENCY.value,
-                    'route': ['sip', 'family'],
-                    'reason': 'enhanced_guard_safety_emergency',
-                    'priority': GuardDecisionPriority.EMERGENCY.value,
-                    'confidence': 0.85
-                }
-            
-            # Priority 3: Wakeword detection
-            if (self.enable_wakeword_enhancement and 
-                wakeword.get('detected') and 
-                wakeword.get('type') == 'emergency'):
-                return {
-                    'decision': GuardDecisionType.WAKE.value,
-                    'reason': f"enhanced_guard_wakeword_{wakeword.get('type')}",
-                    'priority': GuardDecisionPriority.SAFETY_CRITICAL.value,
-                    'confidence': wakeword.get('confidence', 0.8)
-                }
-            
-            # Priority 4: High risk situations
-            elif safety_assessment.get('level') == 'high_risk':
-                return {
-                    'decision': GuardDecisionType.NEED_CONFIRM.value,
-                    'reason': 'enhanced_guard_high_risk',
-                    'prompt': '检测到可能的安全风险，请确认您是否需要帮助？',
-                    'priority': GuardDecisionPriority.SAFETY_CRITICAL.value,
-                    'confidence': 0.7
-                }
-            
-            # Priority 5: Implicit commands
-            elif (self.enable_implicit_commands and 
-                  implicit_command.get('detected') and 
-                  implicit_command.get('confidence', 0) > 0.7):
-                return {
-                    'decision': GuardDecisionType.ALLOW.value,
-                    'reason': f"enhanced_guard_implicit_{implicit_command.get('command_type')}",
-                    'implicit_command': implicit_command,
-                    'requires_confirmation': implicit_command.get('requires_confirmation', False),
-                    'priority': GuardDecisionPriority.NORMAL.value,
-                    'confidence': implicit_command.get('confidence', 0.7)
-                }
-            
-            # Default: Let other systems handle
-            else:
-                return {
-                    'decision': GuardDecisionType.PASS_TEXT.value,
-                    'reason': 'enhanced_guard_no_trigger',
-                    'priority': GuardDecisionPriority.LOW.value,
-                    'confidence': 0.5
-                }
-                
-        except Exception as e:
-            self.get_logger().error(f"Enhanced guard analysis interpretation error: {e}")
-            return {
-                'decision': GuardDecisionType.PASS_TEXT.value,
-                'reason': 'enhanced_guard_analysis_error'
-            }
+        # Sub-dicts are pulled out once and shared by every rule
+        sections = (
+            analysis.get('sos_detection') or EMPTY_SECTION,
+            analysis.get('safety_assessment') or EMPTY_SECTION,
+            analysis.get('wakeword') or EMPTY_SECTION,
+            analysis.get('implicit_command') or EMPTY_SECTION,
+        )
+        for matches, build_decision in self.analysis_rules:
+            if matches(*sections):
+                return build_decision(*sections)
+        
+        # Default: Let other systems handle
+        return NO_TRIGGER_DECISION
 
     def merge_decisions(self, fastapi_decision: Dict[str, Any], 
-                       enhanced_decision: Dict[str, Any],
+                       enhanced_decision: GuardDecision,
                        enhanced_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Merge decisions from FastAPI Guard and Enhanced Guard."""
-        try:
-            # Emergency decisions from Enhanced Guard take priority
-            enhanced_decision_type = enhanced_decision.get('decision')
-            fastapi_decision_type = fastapi_decision.get('decision')
-            
-            if enhanced_decision_type == GuardDecisionType.DISPATCH_EMERGENCY.value:
-                # Enhanced Guard emergency overrides everything
-                return enhanced_decision
-            
-            # FastAPI emergency decisions are preserved
-            elif fastapi_decision_type == GuardDecisionType.DISPATCH_EMERGENCY.value:
-                # Keep FastAPI emergency decision but add enhanced context
-                merged = fastapi_decision.copy()
-                merged['enhanced_context'] = enhanced_analysis
-                return merged
-            
-            # For non-emergency decisions, combine intelligently
-            else:
-                # Use weighted combination based on confidence and priority
-                enhanced_confidence = enhanced_decision.get('confidence', 0.5)
-                fastapi_confidence = 1.0  # FastAPI decisions are binary, assume high confidence
-                
-                # Calculate combined confidence
-                combined_confidence = (
-                    enhanced_confidence * self.enhanced_weight + 
-                    fastapi_confidence * self.fastapi_weight
-                )
+        # Emergency decisions from Enhanced Guard take priority
+        enhanced_decision_type = enhanced_decision.decision
+        fastapi_decision_type = fastapi_decision.get('decision')
+        
+        if enhanced_decision_type == DECISION_DISPATCH_EMERGENCY:
+            # Enhanced Guard emergency overrides everything
+            return enhanced_decision.as_dict()
+        
+        # FastAPI emergency decisions are preserved
+        elif fastapi_decision_type == DECISION_DISPATCH_EMERGENCY:
+            # Keep FastAPI emergency decision but add enhanced context
+            return fastapi_decision | {'enhanced_context': self.summarize_analysis(enhanced_analysis)}
+        
+        # For non-emergency decisions, combine intelligently
+        else:
+            # Use weighted combination based on confidence and priority
+            enhanced_confidence = enhanced_decision.confidence
+            fastapi_confidence = 1.0  # FastAPI decisions are binary, assume high confidence
+            
+            # Calculate combined confidence
+            combined_confidence = (
+                enhanced_confidence * self.enhanced_weight + 
+                fastapi_confidence * self.fastapi_weight
+            )
+            
+            # Determine final decision
+            # Each branch builds the merged decision in a single dict union
+            if enhanced_confidence > 0.8 and enhanced_decision_type in SAFETY_DECISIONS:
+                # High confidence Enhanced Guard safety decisions take priority
+                return enhanced_decision.as_dict() | {
+                    'fastapi_input': fastapi_decision,
+                    'combined_confidence': combined_confidence
+                }
                 
-                # Determine final decision
-                if enhanced_confidence > 0.8 and enhanced_decision_type in [
-                    GuardDecisionType.DENY.value, 
-                    GuardDecisionType.NEED_CONFIRM.value
-                ]:
-                    # High confidence Enhanced Guard safety decisions take priority
-                    final_decision = enhanced_decision.copy()
-                    final_decision['fastapi_input'] = fastapi_decision
-                    
-                elif fastapi_decision_type in [
-                    GuardDecisionType.DENY.value,
-                    GuardDecisionType.NEED_CONFIRM.value
-                ]:
-                    # FastAPI safety decisions are preserved
-                    final_decision = fastapi_decision.copy()
-                    final_decision['enhanced_context'] = enhanced_analysis
-                    
-                else:
-                    # Default to FastAPI decision with enhanced context
-                    final_decision = fastapi_decision.copy()
-                    final_decision['enhanced_context'] = enhanced_analysis
-                    final_decision['enhanced_decision'] = enhanced_decision
-                    
-                final_decision['combined_confidence'] = combined_confidence
-                return final_decision
+            elif fastapi_decision_type in SAFETY_DECISIONS:
+                # FastAPI safety decisions are preserved
+                return fastapi_decision | {
+                    'enhanced_context': self.summarize_analysis(enhanced_analysis),
+                    'combined_confidence': combined_confidence
+                }
                 
-        except Exception as e:
-            self.get_logger().error(f"Decision merging error: {e}")
-            # Fallback to FastAPI decision
-            return fastapi_decision if fastapi_decision else {
-                'decision': 'pass_text',
-                'reason': 'decision_merge_error'
-            }
+            else:
+                # Default to FastAPI decision with enhanced context
+                return fastapi_decision | {
+                    'enhanced_context': self.summarize_analysis(enhanced_analysis),
+                    'enhanced_decision': enhanced_decision.as_dict(),
+                    'combined_confidence': combined_confidence
+                }
 
     def combine_intent_decisions(self, intent_msg: IntentResult,
                                enhanced_analysis: Dict[str, Any],
@@ -621,36 +1076,37 @@ class GuardFastAPIBridgeNode(Node):
         try:
             # If FastAPI guard provides decision, use it as base
             if fastapi_decision:
-                combined = fastapi_decision.copy()
-                combined['enhanced_context'] = enhanced_analysis
-                combined['original_intent'] = intent_msg.intent_type
+                combined = fastapi_decision | {
+                    'enhanced_context': self.summarize_analysis(enhanced_analysis),
+                    'original_intent': intent_msg.intent_type
+                }
                 
                 # Check if Enhanced Guard suggests denial
-                safety_level = enhanced_analysis.get('safety_assessment', {}).get('level')
+                safety_level = (enhanced_analysis.get('safety_assessment') or EMPTY_SECTION).get('level')
                 if safety_level in ['emergency', 'high_risk']:
-                    combined['decision'] = 'deny'
+                    combined['decision'] = DECISION_DENY
                     combined['reason'] = f'enhanced_guard_safety_override_{safety_level}'
                 
                 return combined
             else:
                 # Create decision based on Enhanced Guard analysis only
-                safety_assessment = enhanced_analysis.get('safety_assessment', {})
+                safety_assessment = enhanced_analysis.get('safety_assessment') or EMPTY_SECTION
                 
                 if safety_assessment.get('level') == 'emergency':
                     return {
-                        'decision': 'dispatch_emergency',
+                        'decision': DECISION_DISPATCH_EMERGENCY,
                         'route': ['sip', 'family'],
                         'reason': 'enhanced_guard_intent_emergency'
                     }
                 elif safety_assessment.get('risk_score', 0) > 0.7:
                     return {
-                        'decision': 'need_confirm',
+                        'decision': DECISION_NEED_CONFIRM,
                         'reason': 'enhanced_guard_high_risk_intent',
                         'prompt': '此操作可能存在风险，请确认是否继续？'
                     }
                 else:
                     return {
-                        'decision': 'allow',
+                        'decision': DECISION_ALLOW,
                         'reason': 'enhanced_guard_intent_safe'
                     }
                     
@@ -661,51 +1117,49 @@ class GuardFastAPIBridgeNode(Node):
     def handle_immediate_emergency(self, analysis: Dict[str, Any]):
         """Handle immediate emergency situations with <100ms response."""
         try:
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             
             # Create immediate emergency response
             emergency_decision = {
-                'decision': GuardDecisionType.DISPATCH_EMERGENCY.value,
+                'decision': DECISION_DISPATCH_EMERGENCY,
                 'route': ['sip', 'family', 'doctor', 'emergency'],
                 'reason': 'enhanced_guard_immediate_emergency',
                 'urgency_level': 4,
                 'immediate_response': True,
-                'enhanced_analysis': analysis,
-                'timestamp': datetime.now().isoformat()
+                'enhanced_analysis_summary': self.summarize_analysis(analysis)
             }
             
             # Publish immediately
             self.publish_guard_decision(emergency_decision)
             
             # Check response time
-            response_time = (time.time() - start_time) * 1000  # ms
-            if response_time <= self.emergency_response_time:
-                self.get_logger().critical(f"✅ Emergency response time: {response_time:.1f}ms")
+            response_ns = time.monotonic_ns() - start_ns
+            if response_ns <= self.emergency_response_time_ns:
+                self.get_logger().critical(f"✅ Emergency response time: {response_ns / 1_000_000:.1f}ms")
             else:
-                self.get_logger().critical(f"⚠️ Emergency response time exceeded: {response_time:.1f}ms")
+                self.get_logger().critical(f"⚠️ Emergency response time exceeded: {response_ns / 1_000_000:.1f}ms")
                 
         except Exception as e:
             self.get_logger().error(f"Immediate emergency handling error: {e}")
 
     def publish_guard_decision(self, decision: Dict[str, Any]):
         """Publish final guard decision."""
-        try:
-            # Add processing metadata
-            decision['published_at'] = datetime.now().isoformat()
-            decision['bridge_node'] = 'guard_fastapi_bridge'
-            
-            # Publish decision
-            decision_msg = String()
-            decision_msg.data = json.dumps(decision)
-            self.guard_decision_pub.publish(decision_msg)
-            
-            # Log decision
-            decision_type = decision.get('decision', 'unknown')
-            reason = decision.get('reason', 'unknown')
-            self.get_logger().info(f"Guard decision published: {decision_type} - {reason}")
-            
-        except Exception as e:
-            self.get_logger().error(f"Guard decision publishing error: {e}")
+        # Add processing metadata; one wall-clock read per publish, which
+        # also stamps emergency decisions that carry no timestamp yet
+        published_at = datetime.now().isoformat()
+        decision['published_at'] = published_at
+        decision.setdefault('timestamp', published_at)
+        decision['bridge_node'] = 'guard_fastapi_bridge'
+        
+        # Publish decision
+        decision_msg = String()
+        decision_msg.data = json_dumps(decision)
+        self.guard_decision_pub.publish(decision_msg)
+        
+        # Log decision
+        decision_type = decision.get('decision', 'unknown')
+        reason = decision.get('reason', 'unknown')
+        self.get_logger().info(f"Guard decision published: {decision_type} - {reason}")
 
     def validate_intent_callback(self, request, response):
         """Handle service callback for intent validation."""
@@ -721,31 +1175,32 @@ class GuardFastAPIBridgeNode(Node):
                 'confidence': confidence
             }
             
-            # Get FastAPI guard decision
-            fastapi_decision = self.call_fastapi_guard_intent(intent_dict)
+            # Get FastAPI guard decision; the service reply has to wait for it
+            fastapi_decision = self.run_coroutine(self.call_fastapi_guard_intent(intent_dict))
             
             # Combine with enhanced analysis if available
-            if self.last_enhanced_analysis and fastapi_decision:
+            enhanced_analysis = self.last_enhanced_analysis
+            if enhanced_analysis and fastapi_decision:
                 combined_decision = self.combine_intent_decisions(
-                    request.intent_result, self.last_enhanced_analysis, fastapi_decision
+                    request.intent_result, enhanced_analysis, fastapi_decision
                 )
             else:
                 combined_decision = fastapi_decision
             
             # Prepare response
             if combined_decision:
-                decision_type = combined_decision.get('decision', 'allow')
+                decision_type = combined_decision.get('decision', DECISION_ALLOW)
                 
                 response.validation_successful = True
-                response.intent_approved = decision_type == 'allow'
-                response.requires_confirmation = decision_type == 'need_confirm'
+                response.intent_approved = decision_type == DECISION_ALLOW
+                response.requires_confirmation = decision_type == DECISION_NEED_CONFIRM
                 response.rejection_reason = combined_decision.get('reason', '')
                 
                 if 'prompt' in combined_decision:
                     response.confirmation_prompt = combined_decision['prompt']
                 
                 response.safety_constraints_updated = True
-                response.guard_analysis = json.dumps(combined_decision)
+                response.guard_analysis = json_dumps(combined_decision)
             else:
                 response.validation_successful = False
                 response.error_message = "Guard validation failed"
@@ -758,102 +1213,113 @@ class GuardFastAPIBridgeNode(Node):
             response.error_message = str(e)
             return response
 
-    def start_monitoring_threads(self):
-        """Start monitoring and metrics threads."""
+    def start_monitoring_timers(self):
+        """Start the metrics and health check timers."""
         try:
-            # Performance monitoring thread
-            perf_thread = threading.Thread(
-                target=self.performance_monitoring_loop,
-                daemon=True
+            # Metrics are a cheap snapshot, published straight from a timer
+            self.metrics_timer = self.create_timer(
+                self.metrics_period, self.publish_performance_metrics,
+                callback_group=self.metrics_callback_group
             )
-            perf_thread.start()
             
-            # Health check thread
-            health_thread = threading.Thread(
-                target=self.health_check_loop,
-                daemon=True
+            # Health probes run as executor callbacks too, on their own group
+            self.health_timer = self.create_timer(
+                self.health_check_period, self.check_guard_health,
+                callback_group=self.health_callback_group
             )
-            health_thread.start()
             
-            self.get_logger().info("Guard bridge monitoring threads started")
+            self.get_logger().info("Guard bridge monitoring timers started")
             
         except Exception as e:
-            self.get_logger().error(f"Monitoring threads start error: {e}")
+            self.get_logger().error(f"Monitoring timers start error: {e}")
 
-    def performance_monitoring_loop(self):
-        """Monitor guard bridge performance."""
-        while rclpy.ok():
-            try:
-                # Calculate performance metrics
-                if self.decision_times:
-                    avg_decision_time = sum(self.decision_times) / len(self.decision_times)
-                    max_decision_time = max(self.decision_times)
-                    
-                    # Clear old times
-                    self.decision_times = self.decision_times[-100:]  # Keep last 100
-                    
-                    # Publish metrics
-                    metrics = {
-                        'avg_decision_time_ms': avg_decision_time,
-                        'max_decision_time_ms': max_decision_time,
-                        'stats': self.decision_stats,
-                        'enhanced_guard_available': self.enhanced_guard_available,
-                        'fastapi_guard_available': self.fastapi_guard_available,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-                    metrics_msg = String()
-                    metrics_msg.data = json.dumps(metrics)
-                    self.guard_metrics_pub.publish(metrics_msg)
-                    
-                    # Alert on performance issues
-                    if (self.get_parameter('monitoring.alert_slow_decisions').value and 
-                        avg_decision_time > self.max_decision_time):
-                        self.get_logger().warning(f"Guard decision performance alert: {avg_decision_time:.1f}ms avg")
-                
-                time.sleep(30)  # Monitor every 30 seconds
+    def publish_performance_metrics(self):
+        """Publish one guard bridge metrics snapshot (timer callback)."""
+        try:
+            recent_times = self.decision_times[:min(self.decision_count, DECISION_TIMES_SIZE)]
+            if recent_times.size:
+                # One O(n) partition places all three order statistics at once
+                ranks = (recent_times.size - 1) * PERCENTILE_FRACTIONS
+                ranks = ranks.astype(np.intp)
+                partitioned = np.partition(recent_times, ranks)
+                p50, p95, p99 = partitioned[ranks].tolist()
+                avg_decision_time = float(recent_times.mean())
+                max_decision_time = float(recent_times.max())
+            else:
+                p50 = p95 = p99 = avg_decision_time = max_decision_time = 0.0
+            
+            metrics = {
+                'avg_decision_time_ms': avg_decision_time,
+                'max_decision_time_ms': max_decision_time,
+                'p50_decision_time_ms': p50,
+                'p95_decision_time_ms': p95,
+                'p99_decision_time_ms': p99,
+                'decision_count': self.decision_count,
+                'stats': dict(self.decision_stats),
+                'enhanced_guard_available': self.enhanced_guard_available,
+                'fastapi_guard_available': self.fastapi_guard_available,
+                'fastapi_breaker_open': not self.guard_call_permitted(),
+                'fastapi_consecutive_failures': self.guard_consecutive_failures,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            self.metrics_msg.data = json_dumps(metrics)
+            self.guard_metrics_pub.publish(self.metrics_msg)
+            
+            # Alert on performance issues, at most every 30 s
+            if self.alert_slow_decisions and avg_decision_time > self.max_decision_time:
+                self.get_logger().warning(
+                    f"Guard decision performance alert: {avg_decision_time:.1f}ms avg",
+                    throttle_duration_sec=30.0
+                )
                 
-            except Exception as e:
-                self.get_logger().error(f"Performance monitoring error: {e}")
-                time.sleep(60)
+        except Exception as e:
+            self.get_logger().error(f"Performance monitoring error: {e}")
 
-    def health_check_loop(self):
-        """Monitor health of guard services."""
-        while rclpy.ok():
-            try:
-                # Check FastAPI guard availability
-                self.test_fastapi_guard_availability()
-                
-                # Check enhanced guard by monitoring recent analysis
-                if self.last_enhanced_analysis:
-                    last_analysis_time = datetime.fromisoformat(
-                        self.last_enhanced_analysis.get('timestamp', datetime.now().isoformat())
-                    )
-                    if (datetime.now() - last_analysis_time).total_seconds() < 60:
-                        self.enhanced_guard_available = True
-                    else:
-                        self.enhanced_guard_available = False
-                        self.get_logger().warning("Enhanced Guard appears inactive")
-                
-                time.sleep(30)  # Health check every 30 seconds
+    def check_guard_health(self):
+        """Check the health of both guard services (timer callback)."""
+        try:
+            # Check FastAPI guard availability
+            self.test_fastapi_guard_availability()
+            
+            # Check enhanced guard by the age of its newest analysis
+            if self.last_analysis_ns:
+                if time.monotonic_ns() - self.last_analysis_ns < ENHANCED_GUARD_STALE_NS:
+                    self.enhanced_guard_available = True
+                else:
+                    self.enhanced_guard_available = False
+                    self.get_logger().warning("Enhanced Guard appears inactive")
                 
-            except Exception as e:
-                self.get_logger().error(f"Health check error: {e}")
-                time.sleep(60)
+        except Exception as e:
+            self.get_logger().error(f"Health check error: {e}")
+
+    def __del__(self):
+        """Clean up when node is destroyed."""
+        try:
+            if hasattr(self, 'fastapi_session'):
+                self.run_coroutine(self.fastapi_session.aclose(), timeout=2.0)
+                self.loop.call_soon_threadsafe(self.loop.stop)
+        except:
+            pass
 
 
 def main(args=None):
     """Main entry point."""
     rclpy.init(args=args)
     
+    node = None
     try:
         node = GuardFastAPIBridgeNode()
-        rclpy.spin(node)
+        executor = MultiThreadedExecutor(num_threads=4)
+        executor.add_node(node)
+        executor.spin()
     except KeyboardInterrupt:
         pass
     except Exception as e:
         print(f"Guard-FastAPI Bridge error: {e}")
     finally:
+        if node is not None:
+            node.destroy_node()
         rclpy.shutdown()
 
 
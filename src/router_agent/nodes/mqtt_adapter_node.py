@@ -9,12 +9,17 @@ Specialized for elderly-friendly device control and monitoring.
 import rclpy
 from rclpy.node import Node
 from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
+from rclpy.logging import LoggingSeverity
 
 import json
 import time
 import threading
+import socket
 import ssl
-from typing import Dict, List, Optional, Tuple, Any, Union
+import unicodedata
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Set, Tuple, Any, Union
+from collections import deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -26,12 +31,32 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ROS2 message imports
 from std_msgs.msg import Header, String, Bool, Float32
 from geometry_msgs.msg import Point
 from elderly_companion.msg import IntentResult, HealthStatus, EmergencyAlert
 
 
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(raw) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class DeviceType(Enum):
     """Smart home device types."""
     LIGHT = "light"
@@ -55,7 +80,7 @@ class DeviceProtocol(Enum):
     ZWAVE = "zwave"
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartDevice:
     """Smart home device representation."""
     device_id: str
@@ -64,14 +89,20 @@ class SmartDevice:
     protocol: DeviceProtocol
     mqtt_topic: Optional[str] = None
     rest_endpoint: Optional[str] = None
-    current_state: Dict[str, Any] = None
-    capabilities: List[str] = None
+    current_state: Optional[Dict[str, Any]] = None
+    capabilities: Optional[List[str]] = None
     elderly_friendly: bool = True
     location: str = ""
     last_updated: Optional[datetime] = None
+    command_topic: Optional[str] = None
+
+    def __post_init__(self):
+        """Derive the command topic once from the device topic."""
+        if self.command_topic is None and self.mqtt_topic:
+            self.command_topic = f"{self.mqtt_topic}/command"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCommand:
     """Device command structure."""
     device_id: str
@@ -82,6 +113,59 @@ class DeviceCommand:
     safety_validated: bool = False
 
 
+# Trailing sentence punctuation that ASR attaches to short spoken commands
+COMMAND_PUNCTUATION_TRANSLATION = str.maketrans('', '', '。！？，、.!?,')
+
+
+def normalize_command_phrase(phrase: str) -> str:
+    """Normalize a spoken command phrase for mapping lookups."""
+    # ASCII phrases cannot change under NFKC, so skip the Unicode pass for them
+    if not phrase.isascii():
+        phrase = unicodedata.normalize('NFKC', phrase)
+    return phrase.translate(COMMAND_PUNCTUATION_TRANSLATION).strip().lower()
+
+
+# Elderly-friendly command phrases -> (action, device_type), keyed by normalized phrase
+ELDERLY_DEVICE_MAPPINGS = MappingProxyType({
+    normalize_command_phrase(phrase): mapping
+    for phrase, mapping in {
+        # Simplified Chinese commands
+        '开灯': ('turn_on', 'light'),
+        '关灯': ('turn_off', 'light'),
+        '开空调': ('turn_on', 'air_conditioner'),
+        '关空调': ('turn_off', 'air_conditioner'),
+        '开电视': ('turn_on', 'tv'),
+        '关电视': ('turn_off', 'tv'),
+        '拉窗帘': ('close', 'curtains'),
+        '开窗帘': ('open', 'curtains'),
+
+        # English commands
+        'turn on lights': ('turn_on', 'light'),
+        'turn off lights': ('turn_off', 'light'),
+        'lights on': ('turn_on', 'light'),
+        'lights off': ('turn_off', 'light'),
+        'turn on tv': ('turn_on', 'tv'),
+        'turn off tv': ('turn_off', 'tv'),
+    }.items()
+})
+
+
+# Publish QoS per command action: idempotent switching is fire-and-forget (0),
+# state-changing safety actions such as unlocking must reach the broker (1)
+MQTT_QOS_BY_ACTION = MappingProxyType({
+    'turn_on': 0,
+    'turn_off': 0,
+    'toggle': 0,
+    'open': 0,
+    'close': 0,
+    'unlock': 1,
+    'lock': 1,
+    'activate': 1,
+    'set_temperature': 1,
+    'set_mode': 1,
+})
+
+
 class MQTTAdapterNode(Node):
     """
     MQTT Adapter Node for smart home integration.
@@ -135,13 +219,17 @@ class MQTTAdapterNode(Node):
         
         # Device management
         self.discovered_devices: Dict[str, SmartDevice] = {}
+        self.devices_by_type: Dict[DeviceType, Set[str]] = {}
         self.device_commands_queue: List[DeviceCommand] = []
-        self.command_history: List[DeviceCommand] = []
+        self.command_history: Deque[DeviceCommand] = deque(maxlen=100)
         
         # MQTT client
         self.mqtt_client = None
         self.mqtt_connected = False
         
+        # Checked once so the paho callback thread skips debug formatting entirely
+        self.debug_logging = self.get_logger().is_enabled_for(LoggingSeverity.DEBUG)
+        
         # HTTP session for REST APIs
         self.http_session = self.create_http_session()
         
@@ -153,26 +241,8 @@ class MQTTAdapterNode(Node):
             'communication': ['speakers', 'intercom']
         }
         
-        # Elderly-friendly device mappings
-        self.elderly_device_mappings = {
-            # Simplified Chinese commands
-            '开灯': {'action': 'turn_on', 'device_type': 'light'},
-            '关灯': {'action': 'turn_off', 'device_type': 'light'},
-            '开空调': {'action': 'turn_on', 'device_type': 'air_conditioner'},
-            '关空调': {'action': 'turn_off', 'device_type': 'air_conditioner'},
-            '开电视': {'action': 'turn_on', 'device_type': 'tv'},
-            '关电视': {'action': 'turn_off', 'device_type': 'tv'},
-            '拉窗帘': {'action': 'close', 'device_type': 'curtains'},
-            '开窗帘': {'action': 'open', 'device_type': 'curtains'},
-            
-            # English commands
-            'turn on lights': {'action': 'turn_on', 'device_type': 'light'},
-            'turn off lights': {'action': 'turn_off', 'device_type': 'light'},
-            'lights on': {'action': 'turn_on', 'device_type': 'light'},
-            'lights off': {'action': 'turn_off', 'device_type': 'light'},
-            'turn on tv': {'action': 'turn_on', 'device_type': 'tv'},
-            'turn off tv': {'action': 'turn_off', 'device_type': 'tv'},
-        }
+        # Elderly-friendly device mappings (shared, read-only)
+        self.elderly_device_mappings = ELDERLY_DEVICE_MAPPINGS
         
         # QoS profiles
         default_qos = QoSProfile(
@@ -243,9 +313,12 @@ class MQTTAdapterNode(Node):
             status_forcelist=[429, 500, 502, 503, 504],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Discovery and device commands hit the same few hosts, so keep connections warm
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=16,
+                              pool_maxsize=32, pool_block=False)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        session.headers.update({'Connection': 'keep-alive'})
         
         return session
 
@@ -290,6 +363,15 @@ class MQTTAdapterNode(Node):
             self.mqtt_connected = True
             self.get_logger().info("Connected to MQTT broker successfully")
             
+            # Commands are small and latency sensitive, so send them without Nagle delay
+            sock = client.socket()
+            if sock is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+                except OSError as e:
+                    self.get_logger().warning(f"Could not tune MQTT socket: {e}")
+            
             # Subscribe to device topics
             self.subscribe_to_device_topics()
             
@@ -308,19 +390,20 @@ class MQTTAdapterNode(Node):
         """Handle MQTT message callback."""
         try:
             topic = msg.topic
-            payload = msg.payload.decode('utf-8')
             
-            self.get_logger().debug(f"MQTT message received - Topic: {topic}, Payload: {payload}")
+            if self.debug_logging:
+                self.get_logger().debug(f"MQTT message received - Topic: {topic}, Payload: {msg.payload!r}")
             
             # Process device status updates
-            self.process_device_status_update(topic, payload)
+            self.process_device_status_update(topic, msg.payload)
             
         except Exception as e:
             self.get_logger().error(f"MQTT message processing error: {e}")
 
     def on_mqtt_publish(self, client, userdata, mid):
         """Handle MQTT publish callback."""
-        self.get_logger().debug(f"MQTT message published: {mid}")
+        if self.debug_logging:
+            self.get_logger().debug(f"MQTT message published: {mid}")
 
     def subscribe_to_device_topics(self):
         """Subscribe to device status topics."""
@@ -370,22 +453,22 @@ class MQTTAdapterNode(Node):
                 'Content-Type': 'application/json'
             }
             
-            # Get device registry
-            response = self.http_session.get(
+            # Get device registry; parse the raw body once and release the connection
+            with self.http_session.get(
                 f"{self.ha_url}/api/config/device_registry",
                 headers=headers,
                 timeout=10
-            )
+            ) as response:
+                if response.status_code != 200:
+                    return
+                devices_data = json_loads(response.content)
             
-            if response.status_code == 200:
-                devices_data = response.json()
-                
-                for device_info in devices_data:
-                    device = self.create_device_from_ha_info(device_info)
-                    if device:
-                        self.discovered_devices[device.device_id] = device
-                
-                self.get_logger().info(f"Discovered {len(devices_data)} Home Assistant devices")
+            for device_info in devices_data:
+                device = self.create_device_from_ha_info(device_info)
+                if device:
+                    self.register_device(device)
+            
+            self.get_logger().info(f"Discovered {len(devices_data)} Home Assistant devices")
                 
         except Exception as e:
             self.get_logger().error(f"Home Assistant device discovery error: {e}")
@@ -457,13 +540,21 @@ class MQTTAdapterNode(Node):
             ]
             
             for device in default_devices:
-                self.discovered_devices[device.device_id] = device
+                self.register_device(device)
                 
             self.get_logger().info(f"Initialized {len(default_devices)} default devices")
             
         except Exception as e:
             self.get_logger().error(f"Default device initialization error: {e}")
 
+    def register_device(self, device: SmartDevice):
+        """Add or replace a device and keep the per-type index in step."""
+        previous = self.discovered_devices.get(device.device_id)
+        if previous is not None:
+            self.devices_by_type[previous.device_type].discard(device.device_id)
+        self.discovered_devices[device.device_id] = device
+        self.devices_by_type.setdefault(device.device_type, set()).add(device.device_id)
+
     def handle_smart_home_intent_callback(self, msg: IntentResult):
         """Handle validated smart home intents."""
         try:
@@ -568,8 +659,6 @@ class MQTTAdapterNode(Node):
             
             # Add to command history
             self.command_history.append(command)
-            if len(self.command_history) > 100:
-                self.command_history = self.command_history[-100:]
                 
         except Exception as e:
             self.get_logger().error(f"Device command execution error: {e}")
@@ -585,8 +674,9 @@ class MQTTAdapterNode(Node):
             payload = self.prepare_mqtt_payload(device, command)
             
             # Publish command
-            topic = f"{device.mqtt_topic}/command"
-            self.mqtt_client.publish(topic, json.dumps(payload))
+            topic = device.command_topic
+            self.mqtt_client.publish(topic, json_dumps_bytes(payload),
+                                     qos=MQTT_QOS_BY_ACTION.get(command.action, 0), retain=False)
             
             self.get_logger().info(f"MQTT command sent to {topic}: {payload}")
             
@@ -598,6 +688,52 @@ class MQTTAdapterNode(Node):
             self.get_logger().error(f"MQTT command execution error: {e}")
             self.publish_command_result("error", str(e))
 
+    def execute_device_commands_batch(self, commands: List[DeviceCommand]):
+        """Execute several device commands with back-to-back MQTT publishes."""
+        try:
+            if not commands:
+                return
+            
+            # Serialize every MQTT payload before touching the client so the
+            # publishes go out in one burst; other protocols take the normal path
+            outgoing = []
+            for command in commands:
+                device = self.discovered_devices.get(command.device_id)
+                if device and device.protocol == DeviceProtocol.MQTT and self.mqtt_connected:
+                    payload = self.prepare_mqtt_payload(device, command)
+                    outgoing.append((command, device.command_topic, json_dumps_bytes(payload),
+                                     MQTT_QOS_BY_ACTION.get(command.action, 0)))
+                else:
+                    self.execute_device_command(command)
+            
+            if not outgoing:
+                return
+            
+            # One failed publish (e.g. a device without a command topic) must
+            # not hold back the remaining emergency actuations
+            publish = self.mqtt_client.publish
+            sent = []
+            failures = []
+            for command, topic, payload, qos in outgoing:
+                try:
+                    publish(topic, payload, qos=qos, retain=False)
+                    sent.append(command)
+                except Exception as e:
+                    self.get_logger().error(f"MQTT batch publish error for {command.device_id}: {e}")
+                    failures.append(f"{command.device_id}: {e}")
+            
+            self.command_history.extend(sent)
+            
+            if sent:
+                self.get_logger().info(f"MQTT batch sent: {len(sent)} commands")
+                self.publish_command_result("success", f"{len(sent)} commands sent")
+            if failures:
+                self.publish_command_result("error", "; ".join(failures))
+            
+        except Exception as e:
+            self.get_logger().error(f"Batch command execution error: {e}")
+            self.publish_command_result("error", str(e))
+
     def prepare_mqtt_payload(self, device: SmartDevice, command: DeviceCommand) -> Dict[str, Any]:
         """Prepare MQTT payload for device command."""
         try:
@@ -648,7 +784,7 @@ class MQTTAdapterNode(Node):
             # Send request
             response = self.http_session.post(
                 device.rest_endpoint,
-                json=payload,
+                data=json_dumps_bytes(payload),
                 headers=headers,
                 timeout=self.get_parameter('devices.command_timeout').value
             )
@@ -695,8 +831,7 @@ class MQTTAdapterNode(Node):
             # Execute emergency device protocols
             emergency_commands = self.generate_emergency_device_commands(msg)
             
-            for command in emergency_commands:
-                self.execute_device_command(command)
+            self.execute_device_commands_batch(emergency_commands)
             
         except Exception as e:
             self.get_logger().error(f"Emergency device coordination error: {e}")
@@ -709,29 +844,33 @@ class MQTTAdapterNode(Node):
             timestamp = datetime.now()
             
             if alert.emergency_type in ["medical", "fall"]:
-                # Turn on all lights for visibility
+                # Turn on the configured emergency lights for visibility
+                discovered_lights = self.devices_by_type.get(DeviceType.LIGHT, ())
                 for device_id in self.emergency_devices['lights']:
-                    if device_id in self.discovered_devices:
-                        commands.append(DeviceCommand(
-                            device_id=device_id,
-                            action="turn_on",
-                            parameters={"brightness": 100, "emergency": True},
-                            timestamp=timestamp,
-                            user_intent="emergency",
-                            safety_validated=True
-                        ))
+                    if device_id not in discovered_lights:
+                        continue
+                    commands.append(DeviceCommand(
+                        device_id=device_id,
+                        action="turn_on",
+                        parameters={"brightness": 100, "emergency": True},
+                        timestamp=timestamp,
+                        user_intent="emergency",
+                        safety_validated=True
+                    ))
                 
-                # Unlock doors for emergency responders
+                # Unlock only the configured emergency doors for responders
+                discovered_locks = self.devices_by_type.get(DeviceType.DOOR_LOCK, ())
                 for device_id in self.emergency_devices['security']:
-                    if device_id in self.discovered_devices and 'lock' in device_id:
-                        commands.append(DeviceCommand(
-                            device_id=device_id,
-                            action="unlock",
-                            parameters={"emergency_override": True},
-                            timestamp=timestamp,
-                            user_intent="emergency",
-                            safety_validated=True
-                        ))
+                    if device_id not in discovered_locks:
+                        continue
+                    commands.append(DeviceCommand(
+                        device_id=device_id,
+                        action="unlock",
+                        parameters={"emergency_override": True},
+                        timestamp=timestamp,
+                        user_intent="emergency",
+                        safety_validated=True
+                    ))
             
             elif alert.emergency_type == "security":
                 # Activate security devices
@@ -752,19 +891,21 @@ class MQTTAdapterNode(Node):
             self.get_logger().error(f"Emergency command generation error: {e}")
             return []
 
-    def process_device_status_update(self, topic: str, payload: str):
+    def process_device_status_update(self, topic: str, payload: Union[bytes, str]):
         """Process device status updates from MQTT."""
         try:
-            # Parse payload
-            try:
-                data = json.loads(payload)
-            except:
-                data = {"value": payload}
-            
-            # Extract device ID from topic
+            # Extract device ID from topic; payloads for unknown devices are never parsed
             device_id = self.extract_device_id_from_topic(topic)
             
             if device_id and device_id in self.discovered_devices:
+                # Parse payload
+                try:
+                    data = json_loads(payload)
+                except:
+                    if isinstance(payload, bytes):
+                        payload = payload.decode('utf-8')
+                    data = {"value": payload}
+                
                 device = self.discovered_devices[device_id]
                 device.current_state = data
                 device.last_updated = datetime.now()
@@ -20,6 +20,7 @@ import time
 import threading
 import queue
 import requests
+from requests.adapters import HTTPAdapter
 import asyncio
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
@@ -238,8 +239,15 @@ class SmartHomeBackendNode(Node):
         self.ha_session = requests.Session()
         self.ha_session.headers.update({
             'Authorization': f'Bearer {self.ha_token}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
+        ha_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.ha_session.mount('http://', ha_adapter)
+        self.ha_session.mount('https://', ha_adapter)
+        
+        # Reused connection for periodic status pushes to the FastAPI bridge
+        self.bridge_session = requests.Session()
         
         # Command processing
         self.command_queue = queue.Queue(maxsize=100)
@@ -1232,7 +1240,7 @@ class SmartHomeBackendNode(Node):
             }
             
             # Send to FastAPI bridge
-            response = requests.post(
+            response = self.bridge_session.post(
                 f"{self.fastapi_bridge_url}/smart_home_status",
                 json=status_data,
                 timeout=5.0
@@ -1,7 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 import yaml
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 app = FastAPI()
 cfg = yaml.safe_load(open("config/guard.yml","r",encoding="utf-8"))
 
@@ -33,3 +38,15 @@ def check(payload: AsrIn):
         if it.get("intent")=="call.emergency":
             return {"decision":"dispatch_emergency","route":["sip","family","doctor"],"reason":"policy"}
         return {"decision":"allow"}
+
+@app.post("/guard/check/msgpack")
+async def check_msgpack(request: Request):
+    # Same as /guard/check with a msgpack body and reply, for the ROS2 guard bridge
+    if msgpack is None:
+        raise HTTPException(status_code=415, detail="msgpack not installed")
+    payload = AsrIn(**msgpack.unpackb(await request.body()))
+    return Response(content=msgpack.packb(check(payload)), media_type="application/msgpack")
+
+@app.get("/health")
+def health():
+    return {"status":"ok"}
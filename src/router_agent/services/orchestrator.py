@@ -1,7 +1,14 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from concurrent.futures import ThreadPoolExecutor
 import requests, os
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 app = FastAPI()
 GUARD_URL = os.getenv("GUARD_URL","http://guard:7002/guard/check")
 INTENT_URL = os.getenv("INTENT_URL","http://intent:7001/parse_intent")
@@ -16,14 +23,17 @@ def post(url, json_data):
     r.raise_for_status()
     return r.json()
 
-@app.post("/asr_text")
-def handle_asr(req: AsrText):
-    g = post(GUARD_URL, {"type":"asr","text":req.text})
+def run_asr(text, trace):
+    # trace collects the guard/intent sub-results for /asr_text/full
+    g = post(GUARD_URL, {"type":"asr","text":text})
+    trace["guard"] = {"asr": g}
     if g["decision"]=="dispatch_emergency":
         post(SIP_URL, {"callee":"120","reason":"sos"})
         return {"status":"emergency_dispatched"}
-    intent = post(INTENT_URL, {"text":req.text})
+    intent = post(INTENT_URL, {"text":text})
+    trace["intent"] = intent
     g2 = post(GUARD_URL, {"type":"intent","intent":intent})
+    trace["guard"]["intent"] = g2
     if g2["decision"]=="need_confirm":
         return {"status":"need_confirm","prompt":g2.get("prompt")}
     if g2["decision"]=="deny":
@@ -35,3 +45,59 @@ def handle_asr(req: AsrText):
         res = post(SIP_URL, {"callee":intent.get("callee","120"),"reason":intent.get("reason","unknown")})
         return {"status":"ok","adapter":"sip","result":res}
     return {"status":"ok","intent":intent}
+
+@app.post("/asr_text")
+def handle_asr(req: AsrText):
+    return run_asr(req.text, {})
+
+@app.post("/asr_text/full")
+def handle_asr_full(req: AsrText):
+    # One round trip for the bridge: the /asr_text reply plus the guard
+    # decisions and parsed intent behind it
+    trace = {}
+    res = run_asr(req.text, trace)
+    return {**trace, **res}
+
+@app.post("/asr_text/msgpack")
+async def handle_asr_msgpack(request: Request):
+    # Same as /asr_text/full with a msgpack body and reply, for the ROS2 bridge
+    if msgpack is None:
+        raise HTTPException(status_code=415, detail="msgpack not installed")
+    req = AsrText(**msgpack.unpackb(await request.body()))
+    res = await run_in_threadpool(handle_asr_full, req)
+    return Response(content=msgpack.packb(res), media_type="application/msgpack")
+
+class AsrBatchItem(BaseModel):
+    id: str
+    text: str
+
+class AsrBatch(BaseModel):
+    requests: list[AsrBatchItem]
+    full: bool = False  # reply per item as /asr_text/full does
+
+def handle_batch_item(item: AsrBatchItem, full: bool = False):
+    handler = handle_asr_full if full else handle_asr
+    try:
+        return {"id": item.id, "response": handler(AsrText(text=item.text))}
+    except Exception as e:
+        return {"id": item.id, "response": {"status": "error", "reason": str(e)}}
+
+@app.post("/asr_text/batch")
+def handle_asr_batch(req: AsrBatch):
+    if not req.requests:
+        return {"responses": []}
+    with ThreadPoolExecutor(max_workers=min(8, len(req.requests))) as pool:
+        return {"responses": list(pool.map(lambda item: handle_batch_item(item, req.full), req.requests))}
+
+@app.post("/asr_text/batch/msgpack")
+async def handle_asr_batch_msgpack(request: Request):
+    # Same as /asr_text/batch with a msgpack body and reply, for the ROS2 bridge
+    if msgpack is None:
+        raise HTTPException(status_code=415, detail="msgpack not installed")
+    req = AsrBatch(**msgpack.unpackb(await request.body()))
+    res = await run_in_threadpool(handle_asr_batch, req)
+    return Response(content=msgpack.packb(res), media_type="application/msgpack")
+
+@app.get("/health")
+def health():
+    return {"status":"ok"}